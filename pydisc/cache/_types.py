@@ -24,7 +24,7 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Self
+from typing import TYPE_CHECKING, Any, ClassVar, Self
 
 import aiohttp
 
@@ -70,6 +70,68 @@ class CacheProtocol(Protocol):
         ``None`` if it was not present.
     """
 
+    required_events: ClassVar[frozenset[str]] = frozenset(
+        {
+            # store_user
+            "ready",
+            "user_update",
+            "presence_update",
+            "guild_ban_add",
+            "guild_ban_remove",
+            # store_guild, remove_guild, and the roles and scheduled events the guilds hold
+            "guild_create",
+            "guild_update",
+            "guild_delete",
+            "guild_role_create",
+            "guild_role_update",
+            "guild_role_delete",
+            "guild_scheduled_event_create",
+            "guild_scheduled_event_update",
+            "guild_scheduled_event_delete",
+            # store_custom_emoji, store_sticker, store_soundboard_sound and their remove_ counterparts
+            "guild_emojis_update",
+            "guild_stickers_update",
+            "guild_soundboard_sound_create",
+            "guild_soundboard_sound_update",
+            "guild_soundboard_sound_delete",
+            "guild_soundboard_sounds_update",
+            "soundboard_sounds",
+            # store_member, remove_member
+            "guild_member_add",
+            "guild_member_update",
+            "guild_member_remove",
+            "guild_members_chunk",
+            "voice_state_update",
+            # store_channel, remove_channel
+            "channel_create",
+            "channel_update",
+            "channel_delete",
+            # store_thread, remove_thread
+            "thread_create",
+            "thread_update",
+            "thread_delete",
+            "thread_list_sync",
+            "thread_member_update",
+            "thread_members_update",
+            # store_message, remove_message, and the reactions the messages hold
+            "message_create",
+            "message_update",
+            "message_delete",
+            "message_delete_bulk",
+            "message_reaction_add",
+            "message_reaction_remove",
+            "message_reaction_remove_all",
+            "message_reaction_remove_emoji",
+            # store_component, components are dispatched from interactions
+            "interaction_create",
+            # the connection state
+            "resumed",
+        }
+    )
+    """The gateway events this cache depends on. These are always parsed, even when nothing
+    listens or waits for them. Subclasses that store more, or less, should override this.
+    """
+
     def __init__(self, client: Client[Self]) -> None:
         self.client: Client[Self] = client
         self.http: RESTHandler = client.http
@@ -118,6 +180,13 @@ class CacheProtocol(Protocol):
         self.store_user(obj)
         return obj
 
+    def _get_or_create_user(self, data: dict[str, Any]) -> User:
+        # caches backed by a single mapping can override this to resolve the user in one lookup
+        user = self.get_user(int(data["id"]))
+        if user is None:
+            user = self._create_user(data)
+        return user
+
     def _create_message(self, data: dict[str, Any]) -> Message:
         from pydisc.message import Message
 
@@ -165,7 +165,7 @@ class GuildChannel(PartialChannel):
         else:
             me = Object(id=self._cache.client.user.id, type=User)
         permissions = self.overwrites_for(me)
-        return Permissions.send_messages in permissions.allow
+        return permissions.allow.has(Permissions.send_messages)
 
     @property
     def last_message(self) -> Message | None:
@@ -120,10 +120,10 @@ class Client(Generic[C]):
             intents,
             **options,
         )
-        self.events: EventRouter = EventRouter(self)
-        """The event router that allows you to register event listeners."""
         self.cache: C = cache_cls(self)
         """The cache object that allows you to handle your cache."""
+        self.events: EventRouter = EventRouter(self)
+        """The event router that allows you to register event listeners."""
         self._ws: DiscordWebSocketPoller = DiscordWebSocketPoller(
             self.loop,
             self.events,
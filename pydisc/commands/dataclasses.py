@@ -75,25 +75,17 @@ class Command(Generic[P, T]):
         """The command's name."""
         self.description: str = description or callback.__doc__ or "..."
         """The command's description."""
-        self._cog: Cog | None = cog
+        self.cog: Cog | None = cog
+        """The attached cog of this command."""
         self.guilds: Sequence[abc.Snowflake] | None = guilds
         """The guilds this command is bound to."""
-        self._type: CommandType = type
-        self._options: list[Option] = self._get_options()
-
-    @property
-    def type(self) -> CommandType:
+        self.type: CommandType = type
         """The type of this command."""
-        return self._type
-
-    @property
-    def cog(self) -> Cog | None:
-        """Returns the attached cog of this command."""
-        return self._cog
+        self._options: list[Option] = self._get_options()
 
     def _get_options(self) -> list[Option]:
         required_params = 1  # interaction
-        if self._cog is not None:
+        if self.cog is not None:  # pyright: ignore[reportUnknownMemberType]
             required_params = 2  # cog, interaction
 
         try:
@@ -146,7 +138,7 @@ class ContextMenu(Command[P, T]):
 
     def _get_options(self) -> list[Option]:
         required_params = 1  # interaction
-        if self._cog is not None:
+        if self.cog is not None:  # pyright: ignore[reportUnknownMemberType]
             required_params = 2
 
         try:
@@ -170,31 +162,77 @@ class ContextMenu(Command[P, T]):
                     "a required parameter (cog [if in a cog context] or interaction) is missing from the context menu's parameters"
                 )
 
-        remaining = list(params_iter)
+        uom = next(params_iter, None)
+
+        if uom is None:
+            raise SyntaxError("context menu callbacks must take a user or message parameter after the interaction")
 
-        if len(remaining) > 1:
+        if next(params_iter, None) is not None:
             # context menu commands can either take message or user, not more than one parameter
+            remaining = 2 + sum(1 for _ in params_iter)
             raise SyntaxError(
-                f"context menu callbacks take 2 parameters, interaction and user/message, or 3 if in a cog context, not {len(remaining)}"
+                f"context menu callbacks take 2 parameters, interaction and user/message, or 3 if in a cog context, not {remaining + required_params}"
             )
 
-        uom = remaining[0]
-
         if not uom.annotation or uom.annotation is uom.empty:
             raise SyntaxError(
                 "context menu last parameter must be typed with abc.User, User, Member, User | Member, or Message"
             )
 
         ann = uom.annotation
+        typ = _get_context_menu_ann_map().get(ann)
 
-        from pydisc import Message
-        from pydisc.abc import User as AbcUser
-
-        if issubclass(ann, AbcUser):
-            self._type = CommandType.user
-        elif issubclass(ann, Message):
-            self._type = CommandType.message
-        else:
-            raise TypeError(f"invalid annotation provided {ann}, expected Message, abc.User, User, Member, User | Member")
+        if typ is None:
+            typ = _resolve_context_menu_type(ann)
 
+        self.type = typ
         return []
+
+
+_CONTEXT_MENU_ANN_MAP: dict[Any, CommandType] | None = None
+
+
+def _all_subclasses(cls: type) -> set[type]:
+    ret: set[type] = set()
+    stack = [cls]
+
+    while stack:
+        for sub in stack.pop().__subclasses__():
+            if sub not in ret:
+                ret.add(sub)
+                stack.append(sub)
+    return ret
+
+
+def _build_context_menu_ann_map() -> dict[Any, CommandType]:
+    from pydisc.abc import User as AbcUser
+    from pydisc.member import Member
+    from pydisc.message import Message
+
+    user_types = {AbcUser, Member} | _all_subclasses(AbcUser) | _all_subclasses(Member)
+    return {cls: CommandType.user for cls in user_types} | {Message: CommandType.message}
+
+
+def _get_context_menu_ann_map() -> dict[Any, CommandType]:
+    global _CONTEXT_MENU_ANN_MAP
+
+    if _CONTEXT_MENU_ANN_MAP is None:
+        _CONTEXT_MENU_ANN_MAP = _build_context_menu_ann_map()
+    return _CONTEXT_MENU_ANN_MAP
+
+
+def _resolve_context_menu_type(ann: Any) -> CommandType:
+    # slow path for annotations that were not known when the map was built, such as
+    # user-defined subclasses, the result is stored so next lookups hit the map
+    from pydisc.abc import User as AbcUser
+    from pydisc.message import Message
+
+    if isinstance(ann, type) and issubclass(ann, AbcUser):
+        typ = CommandType.user
+    elif isinstance(ann, type) and issubclass(ann, Message):
+        typ = CommandType.message
+    else:
+        raise TypeError(f"invalid annotation provided {ann}, expected Message, abc.User, User, Member, User | Member")
+
+    _get_context_menu_ann_map()[ann] = typ
+    return typ
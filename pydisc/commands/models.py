@@ -32,7 +32,7 @@ from pydisc.flags import Permissions
 from pydisc.mixins import Hashable
 from pydisc.utils import _get_snowflake
 
-from .options import Option
+from .options import Option, _parse_localizations
 
 if TYPE_CHECKING:
     from pydisc.abc import Channel, User
@@ -64,10 +64,12 @@ class ApplicationCommand(Hashable, Mentionable):
     """The handler type of this command. This is only applicable when :attr:`type` is :attr:`CommandType.primary_entry_point`."""
     options: list[Option]
     """This command's options. This is only applicable when :attr:`type` is :attr:`CommandType.chat_input`."""
-    name_localizations: dict[Locale, str]
-    """A mapping of :class:`Locale` and :class:`str` that represent the available localizations of this command's name."""
-    description_localizations: dict[Locale, str]
-    """A mapping of :class:`Locale` and :class:`str` that represent the available localizations of this command's description."""
+    name_localizations: dict[Locale, str] | None
+    """A mapping of :class:`Locale` and :class:`str` that represent the available localizations of this command's name,
+    or ``None`` if there are none."""
+    description_localizations: dict[Locale, str] | None
+    """A mapping of :class:`Locale` and :class:`str` that represent the available localizations of this command's description,
+    or ``None`` if there are none."""
 
     def __init__(self, data: dict[str, Any], cache: CacheProtocol) -> None:
         self.id: int = int(data["id"])
@@ -94,17 +96,9 @@ class ApplicationCommand(Hashable, Mentionable):
             try_enum(EntryPointHandlerType, data["handler"]) if data.get("handler") is not None else None
         )
         self.options: list[Option] = Option.from_dict_array(data.get("options"))
-        self.name_localizations: dict[Locale, str] = dict(
-            map(
-                lambda i: (try_enum(Locale, i[0]), i[1]),
-                data.get("name_localizations", {}).items(),
-            ),
-        )
-        self.description_localizations: dict[Locale, str] = dict(
-            map(
-                lambda i: (try_enum(Locale, i[0]), i[1]),
-                data.get("description_localizations", {}).items(),
-            ),
+        self.name_localizations: dict[Locale, str] | None = _parse_localizations(data.get("name_localizations"))
+        self.description_localizations: dict[Locale, str] | None = _parse_localizations(
+            data.get("description_localizations")
         )
 
     @property
@@ -25,10 +25,12 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import inspect
+from collections.abc import Callable
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar, Union, get_args as _get_args
+from types import UnionType
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar, Union, get_args as _get_args, get_origin
 
-from pydisc.enums import ChannelType, CommandOptionType, Locale, try_enum
+from pydisc.enums import _PRIMITIVE_OPTION_TYPES, ChannelType, CommandOptionType, Locale, try_enum
 from pydisc.utils import resolve_annotation
 
 if TYPE_CHECKING:
@@ -39,6 +41,12 @@ if TYPE_CHECKING:
 C = TypeVar("C", int, str, float)
 
 
+def _parse_localizations(data: dict[str, str] | None) -> dict[Locale, str] | None:
+    if not data:
+        return None
+    return {try_enum(Locale, k): v for k, v in data.items()}
+
+
 def get_args(annotation: Any) -> tuple[Any, ...]:
     cache = {}
     if isinstance(annotation, str):
@@ -104,40 +112,64 @@ def is_channel(obj: type | object) -> TypeIs[abc.Channel]:
     return issubclass(obj, Channel)
 
 
+def _handle_literal_ann(annotation: Any, param: inspect.Parameter, kwargs: dict[str, Any]) -> dict[str, Any]:
+    kwargs["choices"], kwargs["type"] = handle_literal(get_args(annotation), param)
+    return kwargs
+
+
+def _handle_union_ann(annotation: Any, param: inspect.Parameter, kwargs: dict[str, Any]) -> dict[str, Any]:
+    args = get_args(annotation)
+    none_cls = type(None)
+
+    if none_cls in args:
+        kwargs["required"] = False
+        args = tuple(a for a in args if a is not none_cls)
+
+    if len(args) == 1:
+        # Optional[X], resolve X as if it was not wrapped
+        return _resolve_kind(args[0], param, kwargs)
+
+    types = [CommandOptionType.from_type(arg) for arg in args]
+    rtyp = types[0]
+
+    for other in types[1:]:
+        if other is rtyp:
+            continue
+
+        try:
+            rtyp = rtyp._join(other)
+        except ValueError:
+            rtyp = other._join(rtyp)
+
+    kwargs["type"] = rtyp
+    return kwargs
+
+
+def _handle_plain_ann(annotation: Any, param: inspect.Parameter, kwargs: dict[str, Any]) -> dict[str, Any]:
+    kwargs["type"] = CommandOptionType.from_type(annotation)
+    return kwargs
+
+
+_ORIGIN_DISPATCH: dict[Any, Callable[[Any, inspect.Parameter, dict[str, Any]], dict[str, Any]]] = {
+    Literal: _handle_literal_ann,
+    Union: _handle_union_ann,
+    UnionType: _handle_union_ann,
+}
+
+
+def _resolve_kind(annotation: Any, param: inspect.Parameter, kwargs: dict[str, Any]) -> dict[str, Any]:
+    handler = _ORIGIN_DISPATCH.get(get_origin(annotation), _handle_plain_ann)
+    return handler(annotation, param, kwargs)
+
+
 def resolve_args(annotation: Any, param: inspect.Parameter, default_kwargs: dict[str, Any] | None = None) -> dict[str, Any]:
-    required = param.default is not param.empty
+    required = param.default is param.empty
 
     kwargs = default_kwargs or {
         "name": param.name,
         "required": required,
     }
-
-    if annotation is Literal:
-        args = get_args(annotation)
-        kwargs["choices"], kwargs["type"] = handle_literal(args, param)
-    elif annotation is Union:
-        args = get_args(annotation)
-
-        if type(None) in args:
-            kwargs["required"] = required = False
-            param.replace(default=None)
-            args = tuple(a for a in args if a is not type(None))
-
-        if len(args) == 1:
-            arg = type(args[0])
-
-            if arg is Enum:
-                kwargs["choices"], kwargs["type"] = handle_enum(arg, args, param)
-            elif arg is Literal:
-                kwargs["choices"], kwargs["type"] = handle_literal(args, param)
-            else:
-                raise TypeError(f"unsupported type in Union annotation for {param.name} parameter: {arg}")
-        else:
-            kwargs["type"] = CommandOptionType.from_type(args)
-    else:
-        kwargs["type"] = CommandOptionType.from_type(annotation)
-
-    return kwargs
+    return _resolve_kind(annotation, param, kwargs)
 
 
 class Option:
@@ -185,10 +217,12 @@ class Option:
         """The maximum length of the string value (when :attr:`type` is :attr:`CommandOptionType.string`) for the value to pass the Discord-side checks."""
         self.autocomplete: bool | None = autocomplete
         """Whether this option uses autocomplete or not."""
-        self.name_localizations: dict[Locale, str] = {}
-        """A mapping of :class:`Locale` and :class:`str` that represent the available localizations of this option's name."""
-        self.description_localizations: dict[Locale, str] = {}
-        """A mapping of :class:`Locale` and :class:`str` that represent the available localizations of this option's description."""
+        self.name_localizations: dict[Locale, str] | None = None
+        """A mapping of :class:`Locale` and :class:`str` that represent the available localizations of this option's name,
+        or ``None`` if there are none."""
+        self.description_localizations: dict[Locale, str] | None = None
+        """A mapping of :class:`Locale` and :class:`str` that represent the available localizations of this option's description,
+        or ``None`` if there are none."""
         self._parameter: inspect.Parameter | None = None
 
     @classmethod
@@ -198,13 +232,29 @@ class Option:
         if not parameter.annotation or parameter.annotation is parameter.empty:
             raise TypeError(f"application commands must have type annotations, {parameter.name} is missing it")
 
+        # resolved first so string annotations (from __future__ import annotations) can also take the fast path
         resolved = resolve_annotation(parameter.annotation, globalns, localns, cache)
+        if isinstance(resolved, type) and resolved in _PRIMITIVE_OPTION_TYPES:
+            return cls._fast_primitive(parameter, _PRIMITIVE_OPTION_TYPES[resolved])
+
         kwargs = resolve_args(resolved, parameter)
 
         self = Option(**kwargs)
         self._parameter = parameter
         return self
 
+    @classmethod
+    def _fast_primitive(cls, parameter: inspect.Parameter, type: CommandOptionType) -> Option:
+        # str, int, float and bool annotations do not need to go through the
+        # annotation dispatching machinery, so build the option directly
+        self = Option(
+            type,
+            parameter.name,
+            required=parameter.default is parameter.empty,
+        )
+        self._parameter = parameter
+        return self
+
     def to_dict(self) -> dict[str, Any]:
         pd: dict[str, Any] = {
             "name": self.name,
@@ -279,18 +329,8 @@ class Option:
             max_length=max_length,
             autocomplete=autocomplete,
         )
-        self.name_localizations = dict(
-            map(
-                lambda i: (try_enum(Locale, i[0]), i[1]),
-                data.get("name_localizations", {}).items(),
-            ),
-        )
-        self.description_localizations = dict(
-            map(
-                lambda i: (try_enum(Locale, i[0]), i[1]),
-                data.get("description_localizations", {}).items(),
-            ),
-        )
+        self.name_localizations = _parse_localizations(data.get("name_localizations"))
+        self.description_localizations = _parse_localizations(data.get("description_localizations"))
         return self
 
     @classmethod
@@ -312,8 +352,9 @@ class Choice(Generic[C]):
         """The choice displayed name."""
         self.value: C = value
         """The choice value."""
-        self.name_localizations: dict[Locale, str] = {}
-        """A mapping of :class:`Locale` and :class:`str` that represent the available localizations of this choice's name."""
+        self.name_localizations: dict[Locale, str] | None = None
+        """A mapping of :class:`Locale` and :class:`str` that represent the available localizations of this choice's name,
+        or ``None`` if there are none."""
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Choice[C]:
@@ -321,17 +362,15 @@ class Choice(Generic[C]):
             name=data["name"],
             value=data["value"],
         )
-        self.name_localizations = dict(
-            map(
-                lambda i: (try_enum(Locale, i[0]), i[1]),
-                data.get("name_localizations", {}).items(),
-            ),
-        )
+        self.name_localizations = _parse_localizations(data.get("name_localizations"))
         return self
 
     def to_dict(self) -> dict[str, Any]:
-        return {
+        pd: dict[str, Any] = {
             "name": self.name,
             "value": self.value,
-            "name_localizations": self.name_localizations,
         }
+
+        if self.name_localizations:
+            pd["name_localizations"] = {k.value: v for k, v in self.name_localizations.items()}
+        return pd
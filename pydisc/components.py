@@ -25,7 +25,8 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import os
-from collections.abc import Generator
+import threading
+from collections.abc import Callable, Generator
 from typing import TYPE_CHECKING, Any, Literal, Self, overload
 
 from .emoji import Emoji
@@ -44,23 +45,67 @@ __all__ = (
 )
 
 
-def _pd_to_component(payload: dict[str, Any], cache: CacheProtocol) -> Component:
-    typ = int(payload["type"])
+_ACTION_ROW_TYPE: int = ComponentType.action_row.value
+_BUTTON_TYPE: int = ComponentType.button.value
 
-    if typ not in ComponentType:
-        return UnknownComponent(typ, payload)
+# custom IDs are sliced from a pool of random bytes instead of calling
+# os.urandom for every component, the pool is refilled once exhausted
+_RANDOM_POOL_SIZE = 4096
+_random_pool: bytes = b""
+_random_offset: int = 0
+# components may be built from several threads, and two of them must never get the same slice
+_random_lock: threading.Lock = threading.Lock()
+
+
+def _reset_random_pool() -> None:
+    global _random_pool, _random_offset, _random_lock
+
+    _random_pool = b""
+    _random_offset = 0
+    # the lock may have been held by another thread of the parent while forking
+    _random_lock = threading.Lock()
+
+
+# forked processes must not hand out the same IDs as their parent
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_random_pool)
+
+
+def _random_hex(size: int = 16) -> str:
+    global _random_pool, _random_offset
+
+    with _random_lock:
+        if _random_offset + size > len(_random_pool):
+            _random_pool = os.urandom(max(size, _RANDOM_POOL_SIZE))
+            _random_offset = 0
+
+        start = _random_offset
+        _random_offset += size
+        return _random_pool[start:_random_offset].hex()
+
+
+def _serialize_emoji(emoji: str | Emoji | None) -> dict[str, Any] | None:
+    if emoji is None:
+        return None
+    if isinstance(emoji, str):
+        return {"name": emoji}
+    return emoji.to_dict()
+
+
+def _pd_to_component(payload: dict[str, Any], cache: CacheProtocol) -> Component:
+    typ: int = payload["type"]
+    ctor = _COMPONENT_DISPATCH.get(typ)
 
-    if typ == ComponentType.action_row:
-        return ActionRow.from_dict(payload, cache)
-    elif typ == ComponentType.button:
-        return Button.from_dict(payload, cache)
-    else:
+    if ctor is None:
         return UnknownComponent(typ, payload)
+    return ctor(payload, cache)
 
 
 class Component:
     """Represents a Discord component."""
 
+    __slots__ = ("_id",)
+
     def __init__(self) -> None:
         self._id: int | None = None
 
@@ -143,7 +188,22 @@ class Component:
         If the current component does not have nested components, returns the class
         instance itself.
         """
-        yield self
+        children: list[Component] | None = getattr(self, "_components", None)
+
+        if children is None:
+            yield self
+            return
+
+        # depth-first with an explicit stack, children are pushed reversed to keep
+        # their order
+        stack = children[::-1]
+        while stack:
+            node = stack.pop()
+            yield node
+
+            nested: list[Component] | None = getattr(node, "_components", None)
+            if nested:
+                stack.extend(reversed(nested))
 
     def is_dispatchable(self) -> bool:
         """Whether this component can be interacted with."""
@@ -164,7 +224,14 @@ class UnknownComponent(Component):
     data from the API.
     """
 
+    __slots__ = (
+        "_type",
+        "_data",
+    )
+
     def __init__(self, type: int, data: dict[str, Any]) -> None:
+        super().__init__()
+        self.id = data.get("id")
         self._type: ComponentType = try_enum(ComponentType, type)
         self._data: dict[str, Any] = data
 
@@ -186,6 +253,13 @@ class ActionRow(Component):
     - 1 select (of any type)
     """
 
+    __slots__ = (
+        "_components",
+        "_by_id",
+        "_by_custom_id",
+        "_current_weight",
+    )
+
     def __init__(
         self,
         *components: Component,
@@ -193,16 +267,41 @@ class ActionRow(Component):
     ) -> None:
         if len(components) > 5:
             raise ValueError("action rows can have up to 5 children")
-        if sum(c.weight for c in components) > 5:
+        weight = sum(c.weight for c in components)
+        if weight > 5:
             raise ValueError("maximum children weight exceeded, this can take only up 5 buttons OR 1 select (of any type)")
 
         super().__init__()
         self.id = id
         self._components: list[Component] = list(components)
+        self._current_weight: int = weight
+        self._by_id: dict[int, Component] = {}
+        self._by_custom_id: dict[str, Component] = {}
+
+        for component in self._components:
+            self._index_component(component)
+
+    def _index_component(self, component: Component) -> None:
+        if component.id is not None:
+            self._by_id[component.id] = component
+
+        # only already generated custom IDs are indexed, lazily generated ones are
+        # found by the get_component fallback
+        custom_id = getattr(component, "_custom_id", None)
+        if custom_id is not None:
+            self._by_custom_id[custom_id] = component
+
+    def _unindex_component(self, component: Component) -> None:
+        if component.id is not None and self._by_id.get(component.id) is component:
+            del self._by_id[component.id]
+
+        custom_id = getattr(component, "_custom_id", None)
+        if custom_id is not None and self._by_custom_id.get(custom_id) is component:
+            del self._by_custom_id[custom_id]
 
     def to_dict(self) -> dict[str, Any]:
         pd: dict[str, Any] = {
-            "type": self.type.value,
+            "type": _ACTION_ROW_TYPE,
             "components": [c.to_dict() for c in self._components],
         }
         if self.id is not None:
@@ -212,25 +311,59 @@ class ActionRow(Component):
     @classmethod
     def from_dict(cls, data: dict[str, Any], cache: CacheProtocol) -> ActionRow:
         components = [_pd_to_component(c, cache) for c in data["components"]]
-        return ActionRow(*components, id=data.get("id"))
+        return cls._from_dict_fast(components, data.get("id"))
+
+    @classmethod
+    def _from_dict_fast(cls, components: list[Component], id: int | None) -> Self:
+        # takes ownership of the list instead of unpacking it into __init__ and copying it back
+        if len(components) > 5:
+            raise ValueError("action rows can have up to 5 children")
+
+        weight = sum(c.weight for c in components)
+        if weight > 5:
+            raise ValueError("maximum children weight exceeded, this can take only up 5 buttons OR 1 select (of any type)")
+
+        self = cls.__new__(cls)
+        self._id = id
+        self._components = components
+        self._current_weight = weight
+        self._by_id = {}
+        self._by_custom_id = {}
+
+        for component in components:
+            self._index_component(component)
+        return self
 
     @property
     def type(self) -> Literal[ComponentType.action_row]:
         return ComponentType.action_row
 
+    def get_component(
+        self,
+        *,
+        id: int | None = None,
+        custom_id: str | None = None,
+    ) -> Component | None:
+        if id is not None:
+            comp = self._by_id.get(id)
+            # the index may be stale if the component's id was changed after being added
+            if comp is not None and comp.id == id:
+                return comp
+        if custom_id is not None:
+            comp = self._by_custom_id.get(custom_id)
+            if comp is not None and getattr(comp, "custom_id", None) == custom_id:
+                return comp
+        return super().get_component(id=id, custom_id=custom_id)  # pyright: ignore[reportArgumentType]
+
     @property
     def current_weight(self) -> int:
         """Returns the current children's weight on this row."""
-        return sum(c.weight for c in self._components)
+        return self._current_weight
 
     @property
     def components(self) -> list[Component]:
-        """Returns a list of this action row's components.
-
-        This is a shortcut for converting :meth:`.walk_components` into
-        a :class:`list`.
-        """
-        return list(self.walk_components())
+        """Returns a list of this action row's components."""
+        return list(self._components)
 
     def add_component(self, component: Component, /) -> Self:
         """Adds a component to this Action Row.
@@ -248,18 +381,22 @@ class ActionRow(Component):
         ValueError
             The maximum weight of this row has been exceeded.
         TypeError
-            You did not pass a Component instance.
+            You did not pass a Component instance. This is not checked when
+            Python runs with optimizations enabled (``-O``).
         """
 
-        if not isinstance(component, Component):
+        if __debug__ and not isinstance(component, Component):
             raise TypeError(f"expected a Component instance, got {component.__class__.__name__!r}")
 
-        if self.current_weight + component.weight > 5:
+        weight = self._current_weight + component.weight
+        if weight > 5:
             raise ValueError(
                 "maximum children weight has been exceeded, this can take only up to 5 buttons OR 1 select (of any type)"
             )
 
         self._components.append(component)
+        self._current_weight = weight
+        self._index_component(component)
         return self
 
     def remove_component(self, component: Component, /) -> Self:
@@ -274,42 +411,61 @@ class ActionRow(Component):
             The component to remove from this action row.
         """
 
-        try:
-            self._components.remove(component)
-        except ValueError:
-            pass
+        for index, child in enumerate(self._components):
+            if child is component:
+                del self._components[index]
+                self._current_weight -= component.weight
+                self._unindex_component(component)
+                break
 
         return self
 
-    def walk_components(self) -> Generator[Component, None, None]:
-        yield from self._components
-
 
 class _CustomIdComponent(Component):
+    __slots__ = (
+        "_provided_custom_id",
+        "_custom_id",
+    )
+
     def __init__(self, custom_id: str | None) -> None:
         self._provided_custom_id: bool = custom_id is not None
-        self._custom_id: str = custom_id if custom_id is not None else self._generate_custom_id()
+        # generated on first access, components received from the API already have one
+        self._custom_id: str | None = custom_id
 
     def _generate_custom_id(self) -> str:
-        return os.urandom(16).hex()
+        return _random_hex(16)
 
     @property
     def custom_id(self) -> str:
         """Returns the custom ID of this component, used to identify
         the component when receiving interactions.
         """
+        if self._custom_id is None:
+            self._custom_id = self._generate_custom_id()
         return self._custom_id
 
     @custom_id.setter
     def custom_id(self, value: str | None) -> None:
-        if value is None:
-            value = self._generate_custom_id()
         self._custom_id = value
 
 
 class Button(_CustomIdComponent):
     """Represents a Button."""
 
+    __slots__ = (
+        "_dict_cache",
+        "_requires_custom_id",
+        "_style",
+        "_style_value",
+        "_label",
+        "_emoji",
+        "_emoji_dict",
+        "_sku_id",
+        "_sku_id_str",
+        "_url",
+        "_disabled",
+    )
+
     if TYPE_CHECKING:
         _custom_id: str | None
 
@@ -378,26 +534,179 @@ class Button(_CustomIdComponent):
             style = ButtonStyle.premium
             self._custom_id = None
 
+        self._dict_cache: dict[str, Any] | None = None
         self._requires_custom_id: bool = url is None and sku_id is None
         self._style: ButtonStyle = style
-        self.label: str | None = label
-        self.emoji: str | Emoji | None = emoji
-        self.sku_id: int | None = sku_id
-        self.url: str | None = url
-        self.disabled: bool = disabled
+        self._style_value: int = style.value
+        self._label: str | None = label
+        self._emoji: str | Emoji | None = emoji
+        self._emoji_dict: dict[str, Any] | None = _serialize_emoji(emoji)
+        self._sku_id: int | None = sku_id
+        self._sku_id_str: str | None = None if sku_id is None else str(sku_id)
+        self._url: str | None = url
+        self._disabled: bool = disabled
 
         self.id = id
 
+    @classmethod
+    def _construct(
+        cls,
+        style: ButtonStyle,
+        id: int | None,
+        label: str | None,
+        emoji: str | Emoji | None,
+        custom_id: str | None,
+        sku_id: int | None,
+        url: str | None,
+        disabled: bool,
+        requires_custom_id: bool,
+    ) -> Self:
+        # fills the slots directly, skipping the style resolution done in __init__
+        self = cls.__new__(cls)
+        self._id = id
+        self._provided_custom_id = custom_id is not None
+        self._custom_id = custom_id
+        self._dict_cache = None
+        self._requires_custom_id = requires_custom_id
+        self._style = style
+        self._style_value = style.value
+        self._label = label
+        self._emoji = emoji
+        self._emoji_dict = _serialize_emoji(emoji)
+        self._sku_id = sku_id
+        self._sku_id_str = None if sku_id is None else str(sku_id)
+        self._url = url
+        self._disabled = disabled
+        return self
+
+    @classmethod
+    def link(
+        cls,
+        url: str,
+        *,
+        label: str | None = None,
+        emoji: str | Emoji | None = None,
+        id: int | None = None,
+        disabled: bool = False,
+    ) -> Self:
+        """Creates a link button that opens ``url`` when clicked.
+
+        This is equivalent to ``Button(url=url, ...)`` but skips the style resolution.
+        """
+        return cls._construct(ButtonStyle.link, id, label, emoji, None, None, url, disabled, False)
+
+    @classmethod
+    def premium(
+        cls,
+        sku_id: int,
+        *,
+        id: int | None = None,
+        disabled: bool = False,
+    ) -> Self:
+        """Creates a premium button linked to the SKU with ID ``sku_id``.
+
+        This is equivalent to ``Button(sku_id=sku_id, ...)`` but skips the style resolution.
+        """
+        return cls._construct(ButtonStyle.premium, id, None, None, None, sku_id, None, disabled, False)
+
+    @classmethod
+    def styled(
+        cls,
+        style: ButtonStyle = ButtonStyle.secondary,
+        *,
+        label: str | None = None,
+        emoji: str | Emoji | None = None,
+        custom_id: str | None = None,
+        id: int | None = None,
+        disabled: bool = False,
+    ) -> Self:
+        """Creates an interactive button with the provided ``style``.
+
+        This is equivalent to ``Button(style=style, ...)`` but skips the style resolution.
+        If ``custom_id`` is not provided, one is generated when first accessed.
+
+        Raises
+        ------
+        ValueError
+            ``style`` is a link or premium style, use :meth:`link` or :meth:`premium` instead.
+        """
+        if style in (ButtonStyle.link, ButtonStyle.premium):
+            raise ValueError(f"{style} buttons must be created with Button.link or Button.premium")
+
+        return cls._construct(style, id, label, emoji, custom_id, None, None, disabled, True)
+
+    @property
+    def id(self) -> int | None:
+        """Returns this component's ID, or ``None`` if not set."""
+        return self._id
+
+    @id.setter
+    def id(self, value: int | None) -> None:
+        self._id = value
+        self._dict_cache = None
+
     @property
     def custom_id(self) -> str | None:
+        if self._custom_id is None and self._requires_custom_id:
+            self._custom_id = self._generate_custom_id()
         return self._custom_id
 
     @custom_id.setter
     def custom_id(self, value: str | None) -> None:
-        if value is None and self._requires_custom_id:
-            self._custom_id = self._generate_custom_id()
-        else:
-            self._custom_id = value
+        self._custom_id = value
+        self._dict_cache = None
+
+    @property
+    def label(self) -> str | None:
+        """The label of this button."""
+        return self._label
+
+    @label.setter
+    def label(self, value: str | None) -> None:
+        self._label = value
+        self._dict_cache = None
+
+    @property
+    def emoji(self) -> str | Emoji | None:
+        """The emoji of this button."""
+        return self._emoji
+
+    @emoji.setter
+    def emoji(self, value: str | Emoji | None) -> None:
+        self._emoji = value
+        self._emoji_dict = _serialize_emoji(value)
+        self._dict_cache = None
+
+    @property
+    def sku_id(self) -> int | None:
+        """The SKU ID this button is linked to. Only applicable for premium buttons."""
+        return self._sku_id
+
+    @sku_id.setter
+    def sku_id(self, value: int | None) -> None:
+        self._sku_id = value
+        self._sku_id_str = None if value is None else str(value)
+        self._dict_cache = None
+
+    @property
+    def url(self) -> str | None:
+        """The URL this button opens. Only applicable for link buttons."""
+        return self._url
+
+    @url.setter
+    def url(self, value: str | None) -> None:
+        self._url = value
+        self._dict_cache = None
+
+    @property
+    def disabled(self) -> bool:
+        """Whether this button is disabled."""
+        return self._disabled
+
+    @disabled.setter
+    def disabled(self, value: bool) -> None:
+        self._disabled = value
+        self._dict_cache = None
 
     @property
     def style(self) -> ButtonStyle:
@@ -411,26 +720,36 @@ class Button(_CustomIdComponent):
         return ComponentType.button
 
     def to_dict(self) -> dict[str, Any]:
+        # the payload is cached until any of the button's fields is changed,
+        # a copy is returned so callers can not mutate the cached version
+        if self._dict_cache is not None:
+            return self._copy_dict_cache(self._dict_cache)
+
+        optional = (
+            ("id", self._id),
+            ("custom_id", self.custom_id),
+            ("label", self._label),
+            ("emoji", self._emoji_dict),
+            ("sku_id", self._sku_id_str),
+            ("url", self._url),
+        )
         pd: dict[str, Any] = {
-            "type": self.type.value,
-            "style": self.style.value,
-            "disabled": self.disabled,
+            "type": _BUTTON_TYPE,
+            "style": self._style_value,
+            "disabled": self._disabled,
         }
+        pd.update((key, value) for key, value in optional if value is not None)
 
-        if self.label is not None:
-            pd["label"] = self.label
-        if self.emoji is not None:
-            if isinstance(self.emoji, str):
-                emoji = {"name": self.emoji}
-            else:
-                emoji = self.emoji.to_dict()
-
-            pd["emoji"] = emoji
-        if self.sku_id is not None:
-            pd["sku_id"] = str(self.sku_id)
-        if self.url is not None:
-            pd["url"] = self.url
-        return pd
+        self._dict_cache = pd
+        return self._copy_dict_cache(pd)
+
+    @staticmethod
+    def _copy_dict_cache(cached: dict[str, Any]) -> dict[str, Any]:
+        # the emoji is the only nested dict, it is shared with _emoji_dict so it needs its own copy
+        result = cached.copy()
+        if (emoji := result.get("emoji")) is not None:
+            result["emoji"] = emoji.copy()
+        return result
 
     @classmethod
     def from_dict(cls, data: dict[str, Any], cache: CacheProtocol) -> Button:
@@ -444,10 +763,27 @@ class Button(_CustomIdComponent):
         if emoji_data := data.get("emoji"):
             emoji = Emoji.from_dict(emoji_data, cache)
 
-        return Button(
-            style=style,  # pyright: ignore[reportArgumentType]
+        if style is ButtonStyle.link:
+            return cls.link(
+                data["url"],
+                label=data.get("label"),
+                emoji=emoji,
+                id=data.get("id"),
+                disabled=data.get("disabled", False),
+            )
+        elif style is ButtonStyle.premium:
+            return cls.premium(
+                int(data["sku_id"]),
+                id=data.get("id"),
+                disabled=data.get("disabled", False),
+            )
+        return cls.styled(
+            style,
             label=data.get("label"),
             emoji=emoji,
+            custom_id=data.get("custom_id"),
+            id=data.get("id"),
+            disabled=data.get("disabled", False),
         )
 
     def is_dispatchable(self) -> bool:
@@ -461,3 +797,9 @@ class Button(_CustomIdComponent):
         By default, this raises a :exc:`NotImplementedError`.
         """
         raise NotImplementedError
+
+
+_COMPONENT_DISPATCH: dict[int, Callable[[dict[str, Any], CacheProtocol], Component]] = {
+    _ACTION_ROW_TYPE: ActionRow.from_dict,
+    _BUTTON_TYPE: Button.from_dict,
+}
@@ -37,6 +37,18 @@ __all__ = ("ConnectionState",)
 
 
 class ConnectionState:
+    __slots__ = (
+        "client",
+        "intents",
+        "_activity",
+        "_status",
+        "_presence_cache",
+        "_has_presence",
+        "large_threshold",
+        "chunk_on_startup",
+        "max_heartbeat_timeout",
+    )
+
     def __init__(
         self,
         client: Client[Any],
@@ -44,23 +56,52 @@ class ConnectionState:
         *,
         activity: Activity | None = None,
         status: Status | None = None,
-        **options: Any,
+        large_threshold: int = 250,
+        chunk_on_startup: bool = True,
+        max_heartbeat_timeout: float = 30.0,
+        **options: Any,  # the client passes its HTTP options here too
     ) -> None:
         self.client: Client[Any] = client
         self.intents: Intents = intents
-        self.activity: Activity | None = activity
-        self.status: Status | None = status
-        self.large_threshold: int = options.get("large_threshold", 250)
-        self.chunk_on_startup: bool = options.get("chunk_on_startup", True)
-        self.max_heartbeat_timeout: float = options.get("max_heartbeat_timeout", 30.0)
+        self._activity: Activity | None = activity
+        self._status: Status | None = status
+        self._presence_cache: dict[str, Any] | None = None
+        self._has_presence: bool = activity is not None or status is not None
+        self.large_threshold: int = large_threshold
+        self.chunk_on_startup: bool = chunk_on_startup
+        self.max_heartbeat_timeout: float = max_heartbeat_timeout
+
+    @property
+    def activity(self) -> Activity | None:
+        return self._activity
+
+    @activity.setter
+    def activity(self, value: Activity | None) -> None:
+        self._activity = value
+        self._presence_cache = None
+        self._has_presence = value is not None or self._status is not None
+
+    @property
+    def status(self) -> Status | None:
+        return self._status
+
+    @status.setter
+    def status(self, value: Status | None) -> None:
+        self._status = value
+        self._presence_cache = None
+        self._has_presence = value is not None or self._activity is not None
 
     def has_initial_presence(self) -> bool:
-        return self.activity is not None or self.status is not None
+        return self._has_presence
 
     def get_presence_payload(self) -> dict[str, Any]:
-        return {
-            "status": self.status and self.status.value,
-            "game": self.activity and self.activity.to_dict(),
-            "since": 0,
-            "afk": False,
-        }
+        # built once until activity or status are reassigned, in-place changes
+        # to the activity object are not tracked
+        if self._presence_cache is None:
+            self._presence_cache = {
+                "status": self._status and self._status.value,
+                "game": self._activity and self._activity.to_dict(),
+                "since": 0,
+                "afk": False,
+            }
+        return self._presence_cache.copy()
@@ -26,11 +26,27 @@ from __future__ import annotations
 
 import datetime
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, Protocol, Self
+from typing import TYPE_CHECKING, Any, Literal, Protocol, Self, cast
 
 from . import utils
 from .color import Color
 from .flags import AttachmentFlags, EmbedFlags
+from .missing import MISSING
+
+_UTC = datetime.timezone.utc
+# shared by the proxies of unset embed parts, proxies never modify the dict they wrap
+_EMPTY: dict[str, Any] = {}
+
+# (payload key, attribute) pairs that Embed.from_dict stores as they are
+_FROM_DICT_ATTRS = (
+    ("thumbnail", "_thumbnail"),
+    ("video", "_video"),
+    ("provider", "_provider"),
+    ("author", "_author"),
+    ("fields", "_fields"),
+    ("image", "_image"),
+    ("footer", "_footer"),
+)
 
 EmbedType = Literal["rich", "image", "video", "gifv", "article", "link", "poll_result"]
 
@@ -43,29 +59,32 @@ __all__ = (
 
 
 class EmbedProxy:
+    __slots__ = ("_layer",)
+
     def __init__(self, layer: dict[str, Any]) -> None:
-        self.__dict__.update(layer)
+        # the layer is the embed's own dict, so it must not be modified here
+        self._layer: dict[str, Any] = layer
 
     def __len__(self) -> int:
-        return len(self.__dict__)
+        return len(self._layer)
 
-    def __getattr__(self, attr: str) -> None:
-        return None
+    def __getattr__(self, attr: str) -> Any:
+        # _layer is unset on instances made through __new__ (copy, pickle), and dunder
+        # probes must not be answered with None
+        if attr.startswith("__") or attr == "_layer":
+            raise AttributeError(attr)
+        return self._layer.get(attr)
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, EmbedProxy) and self.__dict__ == other.__dict__
+        return isinstance(other, EmbedProxy) and self._layer == other._layer
 
 
 class EmbedMediaProxy(EmbedProxy):
-    def __init__(self, layer: dict[str, Any]) -> None:
-        if "flags" in layer:
-            f = layer.pop("flags")
-            layer["_flags"] = f
-        super().__init__(layer)
+    __slots__ = ()
 
     @property
     def flags(self) -> AttachmentFlags:
-        return AttachmentFlags(self.__dict__.get("_flags", 0))
+        return AttachmentFlags(self._layer.get("flags", 0))
 
 
 if TYPE_CHECKING:
@@ -100,6 +119,23 @@ if TYPE_CHECKING:
 class Embed:
     """Represents a Discord embed."""
 
+    __slots__ = (
+        "title",
+        "type",
+        "url",
+        "description",
+        "_timestamp",
+        "_color",
+        "_footer",
+        "_image",
+        "_thumbnail",
+        "_video",
+        "_provider",
+        "_author",
+        "_fields",
+        "_flags",
+    )
+
     __fields__ = (
         "_timestamp",
         "_color",
@@ -113,6 +149,10 @@ class Embed:
         "_flags",
     )
 
+    # (attribute, payload key) pairs for the parts to_dict copies as they are,
+    # color and timestamp need to be converted so they are handled apart
+    _FIELD_MAP = tuple((f, f[1:]) for f in __fields__ if f not in ("_color", "_timestamp"))
+
     def __init__(
         self,
         *,
@@ -135,29 +175,54 @@ class Embed:
 
     def copy(self) -> Self:
         """Returns a copy of this embed."""
-        return self.__class__.from_dict(self.to_dict())
+        new = self.__class__.__new__(self.__class__)
+
+        for attr in Embed.__slots__:
+            value = getattr(self, attr, MISSING)
+            if value is MISSING:
+                continue
+
+            # the raw parts are mutated in place by the setters, so they must not be shared
+            if attr == "_fields":
+                value = [field.copy() for field in value]
+            elif isinstance(value, dict):
+                value = cast("dict[str, Any]", value).copy()
+            setattr(new, attr, value)
+
+        # subclasses without __slots__ may carry extra attributes
+        if hasattr(self, "__dict__"):
+            new.__dict__.update(self.__dict__)
+        return new
+
+    __copy__ = copy
 
     def __len__(self) -> int:
         total = len(self.title or "") + len(self.description or "")
-        for field in getattr(self, "_fields", []):
+        for field in getattr(self, "_fields", ()):
             total += len(field["name"]) + len(field["value"])
 
-        try:
-            footer = self._footer["text"]
-        except (AttributeError, KeyError):
-            pass
-        else:
-            total += len(footer)
+        footer: dict[str, Any] | None = getattr(self, "_footer", None)
+        if footer is not None:
+            text = footer.get("text")
+            if text:
+                total += len(text)
 
-        try:
-            author = self._author["name"]
-        except (AttributeError, KeyError):
-            pass
-        else:
-            total += len(author)
+        author: dict[str, Any] | None = getattr(self, "_author", None)
+        if author is not None:
+            name = author.get("name")
+            if name:
+                total += len(name)
 
         return total
 
+    def _raw(self, attr: str) -> Any:
+        # returns the raw dict (or list) of an optional part, normalising empty
+        # ones to None the same way their proxies would compare
+        return getattr(self, attr, None) or None
+
+    def _has_fields(self) -> bool:
+        return bool(getattr(self, "_fields", None))
+
     def __bool__(self) -> bool:
         return any(
             (
@@ -165,32 +230,38 @@ class Embed:
                 self.url,
                 self.description,
                 self.color,
-                self.fields,
+                self._has_fields(),
                 self.timestamp,
-                self.author,
-                self.thumbnail,
-                self.footer,
-                self.image,
-                self.provider,
-                self.video,
+                self._raw("_author"),
+                self._raw("_thumbnail"),
+                self._raw("_footer"),
+                self._raw("_image"),
+                self._raw("_provider"),
+                self._raw("_video"),
             )
         )
 
     def __eq__(self, other: Embed) -> bool:
-        return isinstance(other, Embed) and (
-            self.type == other.type
-            and self.title == other.title
+        if self is other:
+            return True
+        if not isinstance(other, Embed):
+            return False
+
+        # cheapest and most likely to differ first
+        return (
+            self.title == other.title
             and self.url == other.url
             and self.description == other.description
+            and self.type == other.type
             and self.color == other.color
-            and self.fields == other.fields
+            and self._raw("_fields") == other._raw("_fields")
             and self.timestamp == other.timestamp
-            and self.author == other.author
-            and self.thumbnail == other.thumbnail
-            and self.footer == other.footer
-            and self.image == other.image
-            and self.provider == other.provider
-            and self.video == other.video
+            and self._raw("_author") == other._raw("_author")
+            and self._raw("_thumbnail") == other._raw("_thumbnail")
+            and self._raw("_footer") == other._raw("_footer")
+            and self._raw("_image") == other._raw("_image")
+            and self._raw("_provider") == other._raw("_provider")
+            and self._raw("_video") == other._raw("_video")
             and self._flags == other._flags
         )
 
@@ -232,7 +303,7 @@ class Embed:
     @property
     def footer(self) -> _EmbedFooterProxy:
         """Returns a proxy for this embed footer."""
-        return EmbedProxy(getattr(self, "_footer", {}))  # pyright: ignore[reportReturnType]
+        return EmbedProxy(getattr(self, "_footer", _EMPTY))  # pyright: ignore[reportReturnType]
 
     def set_footer(
         self,
@@ -241,11 +312,14 @@ class Embed:
         icon_url: str | None = None,
     ) -> Self:
         """Sets a footer to this embed."""
-        self._footer = {}
-        if text is not None:
-            self._footer["text"] = text
-        if icon_url is not None:
-            self._footer["icon_url"] = icon_url
+        if text is not None and icon_url is not None:
+            self._footer = {"text": text, "icon_url": icon_url}
+        elif text is not None:
+            self._footer = {"text": text}
+        elif icon_url is not None:
+            self._footer = {"icon_url": icon_url}
+        else:
+            self._footer = {}
         return self
 
     def remove_footer(self) -> Self:
@@ -259,7 +333,7 @@ class Embed:
     @property
     def image(self) -> _EmbedMediaProxy:
         """Returns a proxy for this embed image."""
-        return EmbedProxy(getattr(self, "_image", {}))  # pyright: ignore[reportReturnType]
+        return EmbedProxy(getattr(self, "_image", _EMPTY))  # pyright: ignore[reportReturnType]
 
     def set_image(self, *, url: str) -> Self:
         """Sets an image to this embed."""
@@ -277,7 +351,7 @@ class Embed:
     @property
     def thumbnail(self) -> _EmbedMediaProxy:
         """Returns a proxy for this embed thumbnail."""
-        return EmbedProxy(getattr(self, "_thumbnail", {}))  # pyright: ignore[reportReturnType]
+        return EmbedProxy(getattr(self, "_thumbnail", _EMPTY))  # pyright: ignore[reportReturnType]
 
     def set_thumbnail(self, *, url: str) -> Self:
         """Sets a thumbnail to this embed."""
@@ -295,17 +369,17 @@ class Embed:
     @property
     def video(self) -> _EmbedMediaProxy:
         """Returns a proxy for this embed video."""
-        return EmbedProxy(getattr(self, "_video", {}))  # pyright: ignore[reportReturnType]
+        return EmbedProxy(getattr(self, "_video", _EMPTY))  # pyright: ignore[reportReturnType]
 
     @property
     def provider(self) -> _EmbedProviderProxy:
         """Returns a proxy for this embed provider contents."""
-        return EmbedProxy(getattr(self, "_provider", {}))  # pyright: ignore[reportReturnType]
+        return EmbedProxy(getattr(self, "_provider", _EMPTY))  # pyright: ignore[reportReturnType]
 
     @property
     def author(self) -> _EmbedAuthorProxy:
         """Returns a proxy for this embed author."""
-        return EmbedProxy(getattr(self, "_author", {}))  # pyright: ignore[reportReturnType]
+        return EmbedProxy(getattr(self, "_author", _EMPTY))  # pyright: ignore[reportReturnType]
 
     def set_author(
         self,
@@ -315,13 +389,14 @@ class Embed:
         icon_url: str | None = None,
     ) -> Self:
         """Sets an author for this embed."""
-        self._author = {
-            "name": name,
-        }
-        if url is not None:
-            self._author["url"] = url
-        if icon_url is not None:
-            self._author["icon_url"] = icon_url
+        if url is None and icon_url is None:
+            self._author = {"name": name}
+        elif url is not None and icon_url is not None:
+            self._author = {"name": name, "url": url, "icon_url": icon_url}
+        elif url is not None:
+            self._author = {"name": name, "url": url}
+        else:
+            self._author = {"name": name, "icon_url": icon_url}
         return self
 
     def remove_author(self) -> Self:
@@ -335,7 +410,8 @@ class Embed:
     @property
     def fields(self) -> list[_EmbedFieldProxy]:
         """Returns a proxy for this embed fields."""
-        return [EmbedProxy(d) for d in getattr(self, "_fields", [])]  # pyright: ignore[reportReturnType]
+        # a snapshot, the proxies share the field dicts instead of copying them
+        return list(map(EmbedProxy, getattr(self, "_fields", ())))  # pyright: ignore[reportReturnType]
 
     def add_field(self, *, name: str, value: str, inline: bool = True) -> Self:
         """Adds a field to this embed."""
@@ -398,26 +474,23 @@ class Embed:
     def to_dict(self) -> dict[str, Any]:
         """Converts this embed object into a dict."""
 
-        result = {key[1:]: getattr(self, key) for key in Embed.__fields__ if hasattr(self, key)}
+        result: dict[str, Any] = {}
 
-        try:
-            color = result.pop("color")
-        except KeyError:
-            pass
-        else:
-            if color:
-                result["color"] = color.value
+        for attr, key in Embed._FIELD_MAP:
+            value = getattr(self, attr, MISSING)
+            if value is not MISSING:
+                result[key] = value
 
-        try:
-            timestamp = result.pop("timestamp")
-        except KeyError:
-            pass
-        else:
-            if timestamp:
-                if timestamp.tzinfo:
-                    result["timestamp"] = timestamp.astimezone(tz=datetime.timezone.utc).isoformat()
-                else:
-                    result["timestamp"] = timestamp.replace(tzinfo=datetime.timezone.utc).isoformat()
+        color: Color | None = getattr(self, "_color", None)
+        if color:
+            result["color"] = color.value
+
+        timestamp: datetime.datetime | None = getattr(self, "_timestamp", None)
+        if timestamp:
+            if timestamp.tzinfo:
+                result["timestamp"] = timestamp.astimezone(tz=_UTC).isoformat()
+            else:
+                result["timestamp"] = timestamp.replace(tzinfo=_UTC).isoformat()
 
         # add in the non raw attribute ones
         if self.type:
@@ -457,28 +530,24 @@ class Embed:
         if self.url is not None:
             self.url = str(self.url)
 
-        try:
-            self._color = Color(value=data["color"])
-        except KeyError:
-            pass
+        color = data.get("color")
+        if color is not None:
+            self._color = Color(value=color)
 
-        try:
-            self._timestamp = utils.parse_time(data['timestamp'])
-        except KeyError:
-            pass
+        timestamp = data.get("timestamp")
+        if timestamp is not None:
+            self._timestamp = utils.parse_time(timestamp)
 
-        for attr in ("thumbnail", "video", "provider", "author", "fields", "image", "footer"):
-            try:
-                value = data[attr]
-            except KeyError:
-                continue
-            else:
-                setattr(self, f"_{attr}", value)
+        for key, attr in _FROM_DICT_ATTRS:
+            value = data.get(key)
+            if value is not None:
+                setattr(self, attr, value)
 
         return self
 
     @classmethod
-    def from_dict_array(cls, data: list[Mapping[str, Any]] | None) -> list[Embed]:
+    def from_dict_array(cls, data: list[Mapping[str, Any]] | None) -> list[Self]:
         if not data:
             return []
-        return [Embed.from_dict(d) for d in data]
+        # the bound classmethod is resolved once for the whole array
+        return list(map(cls.from_dict, data))
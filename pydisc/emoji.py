@@ -24,6 +24,7 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import array
 import asyncio
 import re
 from typing import TYPE_CHECKING, Any
@@ -35,7 +36,9 @@ if TYPE_CHECKING:
     from .cache._types import CacheProtocol
     from .user import User
 
-CUSTOM_EMOJI_PATTERN = re.compile(r"<?(?:(?P<animated>a)?:)?(?P<name>[A-Za-z0-9\_]+):(?P<id>[0-9]{13,20})>?")
+# matches the custom emoji formats once the surrounding angle brackets have been stripped
+CUSTOM_EMOJI_PATTERN = re.compile(r"(?:(?P<animated>a)?:)?(?P<name>[A-Za-z0-9\_]+):(?P<id>[0-9]{13,20})", re.ASCII)
+_match_custom_emoji = CUSTOM_EMOJI_PATTERN.fullmatch
 
 __all__ = ("Emoji",)
 
@@ -63,7 +66,8 @@ class Emoji(Hashable):
         """Whether this emoji is animated."""
         self.user: User | None = None
         """The user that created this emoji."""
-        self._role_ids: list[int] | None = None
+        # stored as packed 64-bit ints, emojis can live in the cache for the whole session
+        self._role_ids: array.array[int] | None = None
         self.require_colons: bool = False
         """Whether this emoji requires to be wrapped in colons."""
         self.managed: bool = False
@@ -71,13 +75,27 @@ class Emoji(Hashable):
         self.available: bool = True
         """Whether this emoji is available for usage."""
 
-        self._updated: asyncio.Event = asyncio.Event()
+        self._updated_event: asyncio.Event | None = None
+
+    @property
+    def _updated(self) -> asyncio.Event:
+        # most emojis (e.g. unicode ones from from_str) never need this, so it is created lazily
+        if self._updated_event is None:
+            self._updated_event = asyncio.Event()
+        return self._updated_event
 
     def is_partial(self) -> bool:
         """Returns whether this emoji is partial or not. An emoji is considered partial
         when it has not been received from the API or has not been updated with API data.
         """
-        return self._updated.is_set()
+        return self._updated_event is None or not self._updated_event.is_set()
+
+    @property
+    def role_ids(self) -> tuple[int, ...]:
+        """The IDs of the roles allowed to use this emoji, sorted. If empty, everyone can use it."""
+        if self._role_ids is None:
+            return ()
+        return tuple(self._role_ids)
 
     def is_unicode(self) -> bool:
         """Whether this emoji is unicode or not."""
@@ -88,29 +106,29 @@ class Emoji(Hashable):
         return self.id is not None
 
     def __str__(self) -> str:
-        if self.is_unicode():
+        if self.id is None:
             return self.name
-        string = "<{animated}{name}:{id}>"
-        return string.format(
-            animated="a:" if self.animated else "",
-            name=self.name,
-            id=self.id,
-        )
+        if self.animated:
+            return f"<a:{self.name}:{self.id}>"
+        return f"<:{self.name}:{self.id}>"
 
     def _update(self, payload: dict[str, Any], cache: CacheProtocol) -> None:
+        get = payload.get
+
         self.id = _get_snowflake("id", payload) or self.id
         self.name = payload["name"]
-        self.animated = payload.get("animated", self.animated)
-        self._role_ids = list(map(int, payload.get("roles", [])))
-        self.require_colons = payload.get("require_colons", False)
-        self.managed = payload.get("managed", False)
-        self.available = payload.get("available", True)
-
-        if user := payload.get("user"):
+        self.animated = get("animated", self.animated)
+        roles = get("roles")
+        self._role_ids = array.array("q", sorted(map(int, roles))) if roles else None
+        self.require_colons = get("require_colons", False)
+        self.managed = get("managed", False)
+        self.available = get("available", True)
+
+        if user := get("user"):
             if self.user is not None:
                 self.user.__init__(user, cache)
             else:
-                self.user = cache.get_user(int(user["id"])) or cache._create_user(user)
+                self.user = cache._get_or_create_user(user)
 
         self._updated.set()
 
@@ -129,15 +147,23 @@ class Emoji(Hashable):
         Or unicode if none of the previous patterns match.
         """
 
-        match = CUSTOM_EMOJI_PATTERN.match(emoji)
+        # every custom emoji format contains a colon, so unicode emojis can skip the regex
+        if ":" not in emoji:
+            return Emoji(emoji)
 
-        if match is not None:
-            groups = match.groupdict()
+        raw = emoji
+        if raw.startswith("<") and raw.endswith(">"):
+            raw = raw[1:-1]
 
-            animated = bool(groups["animated"])
-            id = int(groups["id"])
-            name = groups["name"]
-            return Emoji(name, id=id, animated=animated)
+        # custom emojis always end with their ID, so anything else is not worth matching
+        if not raw[-1].isdigit():
+            return Emoji(emoji)
+
+        match = _match_custom_emoji(raw)
+
+        if match is not None:
+            animated, name, id = match.groups()
+            return Emoji(name, id=int(id), animated=animated is not None)
         return Emoji(emoji)
 
     def to_dict(self) -> dict[str, Any]:
@@ -156,3 +182,9 @@ class Emoji(Hashable):
         self = Emoji(name=data["name"])
         self._update(data, state)
         return self
+
+    @classmethod
+    def from_dict_array(cls, data: list[dict[str, Any]] | None, state: CacheProtocol) -> list[Emoji]:
+        if not data:
+            return []
+        return [cls.from_dict(d, state) for d in data]
@@ -24,8 +24,9 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
-from enum import Enum as Enumb
-from typing import Any, Self, TypeVar
+from collections.abc import Callable, Iterator, Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Self, TypeVar, cast
 
 E = TypeVar("E", bound="Enum")
 
@@ -72,23 +73,153 @@ __all__ = (
 )
 
 
-class Enum(Enumb):
-
-    # This allows for the enum to not break when an unknown value is
-    # passed to it, as Discord is so unpredictable 🤷‍♂️
-    @classmethod
-    def _missing_(cls, value: object) -> Self:
-        name = f"unknown_{value}"
-        if name in cls.__members__:
-            return cls.__members__[name]
-
-        obj = object.__new__(cls)
-        obj._name_ = name
-        obj._value_ = value
-
-        cls._member_map_[name] = obj
-        cls._value2member_map_[value] = obj
-        return obj
+def _is_descriptor(obj: Any) -> bool:
+    return hasattr(obj, "__get__") or hasattr(obj, "__set__") or hasattr(obj, "__delete__")
+
+
+class EnumMeta(type):
+    # Members are built once, when the class is created, and kept in plain dicts so
+    # looking one up by value is a single dict access instead of going through the
+    # stdlib enum machinery, which is far slower and sits on every payload decode.
+
+    _member_names_: list[str]
+    _member_map_: dict[str, Any]
+    _value2member_map_: dict[Any, Any]
+    # defined on the Enum base below, declared here so the metaclass can call them
+    _new_member: Callable[[str, Any], Any]
+    _missing_: Callable[[Any], Any]
+
+    def __new__(mcs, name: str, bases: tuple[type, ...], attrs: dict[str, Any], **kwargs: Any) -> EnumMeta:
+        members = {key: value for key, value in attrs.items() if key[0] != "_" and not _is_descriptor(value)}
+        for key in members:
+            del attrs[key]
+
+        attrs.setdefault("__slots__", ())
+        member_names: list[str] = []
+        member_map: dict[str, Any] = {}
+        value2member: dict[Any, Any] = {}
+        attrs["_member_names_"] = member_names
+        attrs["_member_map_"] = member_map
+        attrs["_value2member_map_"] = value2member
+
+        cls = super().__new__(mcs, name, bases, attrs, **kwargs)
+
+        for key, value in members.items():
+            member: Any
+            try:
+                member = value2member[value]
+            except KeyError:
+                member = cls._new_member(key, value)
+                value2member[value] = member
+                member_names.append(key)
+            member_map[key] = member
+            type.__setattr__(cls, key, member)
+
+        return cls
+
+    def __call__(cls, value: Any) -> Any:
+        try:
+            return cls._value2member_map_[value]
+        except (KeyError, TypeError):
+            # TypeError: unhashable values, e.g. a malformed payload field, are never in the map
+            if isinstance(value, cls):
+                return value
+            return cls._missing_(value)
+
+    def __iter__(cls) -> Iterator[Any]:
+        member_map = cls._member_map_
+        return (member_map[name] for name in cls._member_names_)
+
+    def __reversed__(cls) -> Iterator[Any]:
+        member_map = cls._member_map_
+        return (member_map[name] for name in reversed(cls._member_names_))
+
+    def __len__(cls) -> int:
+        return len(cls._member_names_)
+
+    def __bool__(cls) -> bool:
+        return True
+
+    def __contains__(cls, value: Any) -> bool:
+        if isinstance(value, cls):
+            return True
+        try:
+            return value in cls._value2member_map_
+        except TypeError:
+            return False
+
+    def __getitem__(cls, name: str) -> Any:
+        return cls._member_map_[name]
+
+    @property
+    def __members__(cls) -> Mapping[str, Any]:
+        return MappingProxyType(cls._member_map_)
+
+    def __repr__(cls) -> str:
+        return f"<enum {cls.__name__!r}>"
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        if name in cls._member_map_:
+            raise AttributeError(f"cannot reassign enum member {name!r}")
+        super().__setattr__(name, value)
+
+    def __delattr__(cls, name: str) -> None:
+        if name in cls._member_map_:
+            raise AttributeError(f"cannot delete enum member {name!r}")
+        super().__delattr__(name)
+
+
+if TYPE_CHECKING:
+    from enum import Enum as Enum
+else:
+
+    class Enum(metaclass=EnumMeta):
+        __slots__ = (
+            "name",
+            "value",
+        )
+
+        @classmethod
+        def _new_member(cls, name: str, value: Any) -> Self:
+            obj = object.__new__(cls)
+            object.__setattr__(obj, "name", name)
+            object.__setattr__(obj, "value", value)
+            return obj
+
+        # This allows for the enum to not break when an unknown value is
+        # passed to it, as Discord is so unpredictable 🤷‍♂️
+        @classmethod
+        def _missing_(cls, value: object) -> Self:
+            # unknown members are cached by value, so a repeated miss never reaches this
+            obj = cls._new_member(f"unknown_{value}", value)
+            try:
+                cls._value2member_map_[value] = obj
+            except TypeError:
+                # unhashable values can only be cached, and found again, by name
+                return cls._member_map_.setdefault(obj.name, obj)
+            cls._member_map_.setdefault(obj.name, obj)
+            return obj
+
+        def __repr__(self) -> str:
+            return f"<{self.__class__.__name__}.{self.name}: {self.value!r}>"
+
+        def __str__(self) -> str:
+            return f"{self.__class__.__name__}.{self.name}"
+
+        def __setattr__(self, name: str, value: Any) -> None:
+            raise AttributeError("enum members are read-only")
+
+        def __delattr__(self, name: str) -> None:
+            raise AttributeError("enum members are read-only")
+
+        def __reduce_ex__(self, protocol: Any) -> tuple[Any, ...]:
+            return self.__class__, (self.value,)
+
+        def __copy__(self) -> Self:
+            return self
+
+        def __deepcopy__(self, memo: Any) -> Self:
+            return self
 
 
 """
@@ -189,28 +320,42 @@ class CommandOptionType(Enum):
 
     @classmethod
     def from_type(cls, typ: Any) -> CommandOptionType:
+        try:
+            return _PRIMITIVE_OPTION_TYPES[typ]
+        except (KeyError, TypeError):
+            pass
+
+        for base, option_type in _get_option_type_bases():
+            if issubclass(typ, base):
+                return option_type
+        raise TypeError(f"unsupported option type: {typ}")
+
+
+_PRIMITIVE_OPTION_TYPES: dict[Any, CommandOptionType] = {
+    str: CommandOptionType.string,
+    int: CommandOptionType.integer,
+    float: CommandOptionType.number,
+    bool: CommandOptionType.boolean,
+}
+_OPTION_TYPE_BASES: tuple[tuple[type, CommandOptionType], ...] | None = None
+
+
+def _get_option_type_bases() -> tuple[tuple[type, CommandOptionType], ...]:
+    global _OPTION_TYPE_BASES
+
+    # built on first use, these modules import this one
+    if _OPTION_TYPE_BASES is None:
         from pydisc.abc import Channel, User
         from pydisc.attachment import Attachment
         from pydisc.role import Role
 
-        if issubclass(typ, Role):
-            return cls.role
-        elif issubclass(typ, User):
-            return cls.user
-        elif issubclass(typ, Channel):
-            return cls.channel
-        elif issubclass(typ, Attachment):
-            return cls.attachment
-        elif typ is int:
-            return cls.integer
-        elif typ is float:
-            return cls.number
-        elif typ is bool:
-            return cls.boolean
-        elif typ is str:
-            return cls.string
-        else:
-            raise TypeError(f"unsupported option type: {typ}")
+        _OPTION_TYPE_BASES = (
+            (Role, CommandOptionType.role),
+            (User, CommandOptionType.user),
+            (Channel, CommandOptionType.channel),
+            (Attachment, CommandOptionType.attachment),
+        )
+    return _OPTION_TYPE_BASES
 
 
 class Locale(Enum):
@@ -626,4 +771,10 @@ class ScheduledEventStatus(Enum):
 
 
 def try_enum(cls: type[E], value: Any) -> E:
-    return cls(value)
+    try:
+        member = cls._value2member_map_.get(value)
+    except TypeError:
+        return cls(value)
+    if member is None:
+        return cls(value)
+    return cast(E, member)
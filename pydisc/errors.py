@@ -24,7 +24,8 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
     from aiohttp import ClientResponse, ClientWebSocketResponse
@@ -49,21 +50,29 @@ class PydiscException(Exception):
 
 
 def _flatten_error_dict(d: dict[str, Any], key: str = "") -> dict[str, str]:
-    items: list[tuple[str, str]] = []
-    for k, v in d.items():
-        new_key = f"{key}.{k}" if key else k
-
-        if isinstance(v, dict):
-            v: dict[Any, Any]
-            try:
-                _errors: list[dict[str, Any]] = v["_errors"]
-            except KeyError:
-                items.extend(_flatten_error_dict(v, new_key).items())
+    out: dict[str, str] = {}
+    # a stack of (key prefix, items iterator) keeps the payload order without recursing
+    stack: list[tuple[str, Iterator[tuple[str, Any]]]] = [(key, iter(d.items()))]
+
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            new_key = f"{prefix}.{k}" if prefix else k
+
+            if type(v) is dict:
+                nested = cast("dict[str, Any]", v)
+                try:
+                    _errors: list[dict[str, Any]] = nested["_errors"]
+                except KeyError:
+                    stack.append((new_key, iter(nested.items())))
+                    break
+                else:
+                    out[new_key] = " ".join(x.get("message", "") for x in _errors)
             else:
-                items.append((new_key, " ".join(x.get("message", "") for x in _errors)))
+                out[new_key] = v
         else:
-            items.append((new_key, v))
-    return dict(items)
+            stack.pop()
+    return out
 
 
 class HTTPException(PydiscException):
@@ -72,21 +81,21 @@ class HTTPException(PydiscException):
     def __init__(self, response: _Response, message: dict[str, Any] | str | None) -> None:
         self.response: _Response = response
         """The response that failed."""
-        self.status: int = response.status  # type: ignore # filled even when using requests
+        self.status: int = cast(int, response.status)  # type: ignore # filled even when using requests
         """The failure status code."""
         self.code: int
         """The status code in which the request failed."""
         self.text: str
         """The text of the error. This could be empty."""
+        self._errors: dict[str, Any] | None = None
 
         if isinstance(message, dict):
             self.code = message.get("code", 0)
             base = message.get("message", "")
             errors = message.get("errors")
-            self._errors: dict[str, Any] | None = errors
+            self._errors = errors
             if errors:
-                errors = _flatten_error_dict(errors)
-                helpful = "\n".join("In %s: %s" % t for t in errors.items())
+                helpful = "\n".join([f"In {k}: {v}" for k, v in _flatten_error_dict(errors).items()])
                 self.text = base + "\n" + helpful
             else:
                 self.text = base
@@ -94,11 +103,11 @@ class HTTPException(PydiscException):
             self.text = message or ""
             self.code = 0
 
-        fmt = "{0.status} {0.reason} (error code: {1})"
-        if len(self.text):
-            fmt += ": {2}"
-
-        super().__init__(fmt.format(self.response, self.code, self.text))
+        reason = self.response.reason
+        if self.text:
+            super().__init__(f"{self.status} {reason} (error code: {self.code}): {self.text}")
+        else:
+            super().__init__(f"{self.status} {reason} (error code: {self.code})")
 
 
 class Forbidden(HTTPException):
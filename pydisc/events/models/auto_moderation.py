@@ -27,9 +27,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from pydisc.enums import AutoModTriggerType, try_enum
-from pydisc.utils import _get_snowflake
 
-from .core import EventModel, _RichGetterModel
+from .core import EventModel, _forward_to_data, _RichGetterModel
 
 __all__ = (
     "AutoModRuleCreate",
@@ -39,8 +38,33 @@ __all__ = (
 )
 
 
+_AutoModRule: type[AutoModRule] | None = None
+_AutoModAction: type[AutoModAction] | None = None
+
+
+def _get_auto_mod_rule() -> type[AutoModRule]:
+    global _AutoModRule
+
+    # imported once on first use rather than inside every event's __init__
+    if _AutoModRule is None:
+        from pydisc.auto_moderation import AutoModRule
+
+        _AutoModRule = AutoModRule
+    return _AutoModRule
+
+
+def _get_auto_mod_action() -> type[AutoModAction]:
+    global _AutoModAction
+
+    if _AutoModAction is None:
+        from pydisc.auto_moderation import AutoModAction
+
+        _AutoModAction = AutoModAction
+    return _AutoModAction
+
+
 if TYPE_CHECKING:
-    from pydisc.auto_moderation import AutoModRule
+    from pydisc.auto_moderation import AutoModAction, AutoModRule
     from pydisc.cache._types import CacheProtocol
 
     class _AutoModEventProxy(_RichGetterModel, AutoModRule):
@@ -48,11 +72,28 @@ if TYPE_CHECKING:
 
 else:
 
+    @_forward_to_data(
+        "id",
+        "guild_id",
+        "creator_id",
+        "name",
+        "event_type",
+        "trigger_type",
+        "trigger_metadata",
+        "actions",
+        "enabled",
+        "exempt_role_ids",
+        "exempt_channel_ids",
+        "creator",
+        "guild",
+        "exempt_roles",
+        "exempt_channels",
+    )
     class _AutoModEventProxy(_RichGetterModel):
-        def __init__(self, data: dict[str, Any], cache: CacheProtocol) -> None:
-            from pydisc.auto_moderation import AutoModRule
+        __slots__ = ()
 
-            self.data = AutoModRule(data, cache)
+        def __init__(self, data: dict[str, Any], cache: CacheProtocol) -> None:
+            self.data = _get_auto_mod_rule()(data, cache)
 
 
 AutoModRuleCreate = _AutoModEventProxy
@@ -66,13 +107,26 @@ AutoModRuleDelete = _AutoModEventProxy
 class AutoModActionExecution(EventModel):
     """Represents an ``on_auto_mod_action_execution`` event payload."""
 
+    __slots__ = (
+        "guild_id",
+        "action",
+        "rule_id",
+        "rule_trigger_type",
+        "user_id",
+        "channel_id",
+        "message_id",
+        "alert_system_message_id",
+        "content",
+        "matched_keyword",
+        "matched_content",
+    )
+
     def __init__(self, data: dict[str, Any], cache: CacheProtocol) -> None:
+        get = data.get
+
         self.guild_id: int = int(data["guild_id"])
         """The guild ID in which the action was executed."""
-
-        from pydisc.auto_moderation import AutoModAction
-
-        self.action: AutoModAction = AutoModAction.from_dict(data["action"])
+        self.action: AutoModAction = _get_auto_mod_action().from_dict(data["action"])
         """The action that was executed."""
 
         self.rule_id: int = int(data["rule_id"])
@@ -81,17 +135,17 @@ class AutoModActionExecution(EventModel):
         """The trigger type of the rule."""
         self.user_id: int = int(data["user_id"])
         """The user ID that actioned the auto mod rule."""
-        self.channel_id: int | None = _get_snowflake("channel_id", data)
+        self.channel_id: int | None = int(v) if (v := get("channel_id")) else None
         """The channel ID in which the content that triggered the action was sent to."""
-        self.message_id: int | None = _get_snowflake("message_id", data)
+        self.message_id: int | None = int(v) if (v := get("message_id")) else None
         """The message ID which had the content blocked. This may be ``None`` if the message was blocked
         by Auto Mod or the content that actioned the rule was not a message.
         """
-        self.alert_system_message_id: int | None = _get_snowflake("alert_system_message_id", data)
+        self.alert_system_message_id: int | None = int(v) if (v := get("alert_system_message_id")) else None
         """The ID of the system message generated as a result of this auto mod rule execution."""
         self.content: str = data["content"]
         """The content that actioned the rule."""
-        self.matched_keyword: str | None = data.get("matched_keyword")
+        self.matched_keyword: str | None = get("matched_keyword")
         """The words or phrases of the auto mod rule that were matched and triggered it."""
-        self.matched_content: str | None = data.get("matched_content")
+        self.matched_content: str | None = get("matched_content")
         """The substring of the auto mod rule that was matched and triggered it."""
@@ -24,9 +24,10 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
-from .core import _RichGetterModel
+from .core import _forward_to_data, _RichGetterModel
 
 __all__ = (
     "ChannelCreate",
@@ -42,12 +43,25 @@ if TYPE_CHECKING:
         data: Channel
 
 else:
+    _channel_factory: Callable[[dict[str, Any], CacheProtocol], Channel] | None = None
 
-    class _ChannelEvent(_RichGetterModel):
-        def __init__(self, data: dict[str, Any], cache: CacheProtocol) -> None:
+    def _get_channel_factory() -> Callable[[dict[str, Any], CacheProtocol], Channel]:
+        global _channel_factory
+
+        # imported once on first use rather than inside every event's __init__
+        if _channel_factory is None:
             from pydisc.channels.factory import channel_factory
 
-            self.data: Channel = channel_factory(data, cache)
+            _channel_factory = channel_factory
+        return _channel_factory
+
+    # channel_factory returns many channel types, only the attributes they all share are forwarded
+    @_forward_to_data("id", "type", "guild")
+    class _ChannelEvent(_RichGetterModel):
+        __slots__ = ()
+
+        def __init__(self, data: dict[str, Any], cache: CacheProtocol) -> None:
+            self.data: Channel = _get_channel_factory()(data, cache)
 
 
 ChannelCreate = _ChannelEvent
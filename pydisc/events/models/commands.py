@@ -30,6 +30,20 @@ from .core import _RichGetterModel
 
 __all__ = ("CommandPermissionsUpdate",)
 
+_ApplicationCommandPermissions: type[ApplicationCommandPermissions] | None = None
+
+
+def _get_application_command_permissions() -> type[ApplicationCommandPermissions]:
+    global _ApplicationCommandPermissions
+
+    # imported once on first use rather than inside every event's __init__
+    if _ApplicationCommandPermissions is None:
+        from pydisc.commands import ApplicationCommandPermissions
+
+        _ApplicationCommandPermissions = ApplicationCommandPermissions
+    return _ApplicationCommandPermissions
+
+
 if TYPE_CHECKING:
     from pydisc.cache._types import CacheProtocol
     from pydisc.commands import ApplicationCommandPermissions
@@ -44,8 +58,8 @@ else:
     class CommandPermissionsUpdate(_RichGetterModel):
         """Represents an ``on_command_permissions_update`` event payload."""
 
-        def __init__(self, data: dict[str, Any], cache: CacheProtocol) -> None:
-            from pydisc.commands import ApplicationCommandPermissions
+        __slots__ = ()
 
-            self.data: ApplicationCommandPermissions = ApplicationCommandPermissions(data, cache)
+        def __init__(self, data: dict[str, Any], cache: CacheProtocol) -> None:
+            self.data: ApplicationCommandPermissions = _get_application_command_permissions()(data, cache)
             """The data of this event."""
@@ -24,11 +24,15 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Self
+from collections.abc import Callable
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Self, TypeVar
 
 if TYPE_CHECKING:
     from pydisc.cache._types import CacheProtocol
 
+RG = TypeVar("RG", bound="_RichGetterModel")
+
 __all__ = (
     "EventModel",
     "_RichGetterModel",
@@ -42,6 +46,8 @@ class EventModel:
     You should type the available attributes for a better UX experience for the users.
     """
 
+    __slots__ = ()
+
     def __init__(self, data: dict[str, Any], cache: CacheProtocol) -> None:
         pass
 
@@ -56,8 +62,22 @@ class EventModel:
 
 
 class _RichGetterModel(EventModel):
+    __slots__ = ("data",)
+
     data: Any
     """The data of this event."""
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self.data, name)
+
+
+def _forward_to_data(*names: str) -> Callable[[type[RG]], type[RG]]:
+    # Properties are found by the normal attribute lookup, so the attributes the wrapped
+    # model is known to have skip the failed lookup and the __getattr__ call. Anything not
+    # listed here still goes through __getattr__.
+    def decorator(cls: type[RG]) -> type[RG]:
+        for name in names:
+            setattr(cls, name, property(attrgetter(f"data.{name}")))
+        return cls
+
+    return decorator
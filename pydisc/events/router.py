@@ -46,17 +46,58 @@ _log = logging.getLogger(__name__)
 __all__ = ("EventRouter",)
 
 
+async def _noop() -> None:
+    pass
+
+
+# gateway event names are a small fixed set, so their lowercased forms are reused instead of re-created
+_EVENT_NAMES: dict[str, str] = {}
+
+
+def _lower_event_name(event: str) -> str:
+    # only for names received from the gateway, see _EVENT_NAMES
+    try:
+        return _EVENT_NAMES[event]
+    except KeyError:
+        lowered = _EVENT_NAMES[event] = event.lower()
+        return lowered
+
+
 class EventRouter:
     """Represents an event emitter for a :class:`Client`.
 
     This may be overriden to add custom behaviour or event dispatching.
     """
 
+    __slots__ = (
+        "client",
+        "task_set",
+        "_events",
+        "_waiters",
+        "_waiter_counts",
+        "_parsers",
+        "_required_events",
+    )
+
     def __init__(self, client: Client[Any]) -> None:
         self.client: Client[Any] = client
         self.task_set: set[asyncio.Task[Any]] = set()
-        self._events: dict[str, list[Coro[Any]]] = {}
-        self._waiters: dict[str, list[asyncio.Future[Any]]] = {}
+        # read on every dispatched event but rarely changed, so handlers are kept as tuples
+        self._events: dict[str, tuple[Coro[Any], ...]] = {}
+        # one future per event, shared by every waiter so resolving it wakes them all at once
+        self._waiters: dict[str, asyncio.Future[None]] = {}
+        self._waiter_counts: dict[asyncio.Future[None], int] = {}
+        self._parsers: dict[str, Callable[[dict[str, Any], ConnectionState], EventModel]] = self._collect_parsers()
+        # the events the cache relies on are parsed even when nothing listens or waits for them
+        self._required_events: frozenset[str] = client.cache.required_events
+
+    def _collect_parsers(self) -> dict[str, Callable[[dict[str, Any], ConnectionState], EventModel]]:
+        # every parse_<event> method, including the ones added by subclasses, looked up once
+        return {
+            name[6:]: getattr(self, name)
+            for name in dir(type(self))
+            if name.startswith("parse_") and name != "parse_event" and callable(getattr(self, name))
+        }
 
     @property
     def _connection(self) -> ConnectionState:
@@ -66,9 +107,18 @@ class EventRouter:
     def cache(self) -> CacheProtocol:
         return self.client.cache
 
-    async def _invoke(self, coros: list[Coro[Any]], args: Any, kwargs: dict[str, Any]) -> None:
+    async def _invoke(self, coros: tuple[Coro[Any], ...], args: Any, kwargs: dict[str, Any]) -> None:
         loop = asyncio.get_running_loop()
-        tasks = [loop.create_task(coro(*args, **kwargs)) for coro in coros]
+        # handlers are started eagerly, so the ones that finish without awaiting anything
+        # are done right here instead of waiting for a loop iteration. asyncio.gather is
+        # kept over a TaskGroup so a failing handler does not cancel the other ones.
+        eager_task = asyncio.eager_task_factory
+        if not kwargs and len(args) == 1:
+            # parsed events only pass their model, so skip the argument unpacking per handler
+            model = args[0]
+            tasks = [eager_task(loop, coro(model)) for coro in coros]
+        else:
+            tasks = [eager_task(loop, coro(*args, **kwargs)) for coro in coros]
         await asyncio.gather(*tasks)
 
     @overload
@@ -104,23 +154,27 @@ class EventRouter:
         If ``async_invoke`` is ``True``, then this returns a coroutine that must be awaited
         in order for the dispatch to be completed.
         """
-        coros = self._events.get(event, [])
+        coros = self._events.get(event)
+        # most gateway events have no listeners, so skip all the dispatch work for them
+        if not coros:
+            return _noop() if async_invoke is True else None
+
         loop = asyncio.get_running_loop()
         args = args or ()
         kwargs = kwargs or {}
 
-        _log.debug("Invoking event %s (locked: %s) with args %s and kwargs %s", event, async_invoke, args, kwargs)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("Invoking event %s (locked: %s) with args %s and kwargs %s", event, async_invoke, args, kwargs)
 
         if async_invoke is True:
             return self._invoke(coros, args, kwargs)
 
+        create_task = loop.create_task
+        task_set = self.task_set
         for coro in coros:
-            task = asyncio.ensure_future(
-                coro(*args, **kwargs),
-                loop=loop,
-            )
-            self.task_set.add(task)
-            task.add_done_callback(self.task_set.discard)
+            task = create_task(coro(*args, **kwargs))
+            task_set.add(task)
+            task.add_done_callback(task_set.discard)
 
     @overload
     async def parse_event(
@@ -148,11 +202,14 @@ class EventRouter:
         async_invoke: bool = False,
     ) -> None | Coroutine[None, None, None]:
         """Parses an event received via the Discord WebSocket."""
-        event = event.lower()
+        event = _lower_event_name(event)
 
-        try:
-            parser: Callable[[dict[str, Any], ConnectionState], EventModel] = getattr(self, f"parse_{event}")
-        except AttributeError:
+        # building a model nobody will receive is wasted work, unless the cache depends on it
+        if event not in self._required_events and not self._events.get(event) and event not in self._waiters:
+            return _noop() if async_invoke is True else None
+
+        parser = self._parsers.get(event)
+        if parser is None:
             _log.warning(
                 "Could not parse event %s with data %s. This is a library bug, consider opening "
                 "an issue at https://github.com/DA-344/pydisc/issues",
@@ -163,20 +220,47 @@ class EventRouter:
 
         parsed = parser(data, self._connection)
 
-        for fut in self._waiters.get(event, []):
+        fut = self._waiters.pop(event, None)
+        if fut is not None and not fut.done():
             fut.set_result(None)
-        self._waiters.pop(event, None)
 
         if async_invoke is True:
             return self._parse_event(event, parsed)
 
         loop = asyncio.get_running_loop()
-        task = asyncio.ensure_future(
-            self._parse_event(event, parsed),
-            loop=loop,
-        )
-        self.task_set.add(task)
-        task.add_done_callback(self.task_set.discard)
+        # started eagerly, models whose setup and handlers never suspend are fully dispatched here
+        task = asyncio.eager_task_factory(loop, self._parse_event(event, parsed))
+        if not task.done():
+            self.task_set.add(task)
+            task.add_done_callback(self.task_set.discard)
+
+    async def wait_for(self, event: str) -> None:
+        """Waits until ``event`` is next received from the Discord WebSocket.
+
+        Parameters
+        ----------
+        event: :class:`str`
+            The name of the event to wait for, e.g. ``"message_create"``. This is case-insensitive.
+        """
+        # lowered directly, only gateway names go through the memo so caller input cannot grow it
+        event = event.lower()
+        fut = self._waiters.get(event)
+        if fut is None:
+            fut = self._waiters[event] = asyncio.get_running_loop().create_future()
+
+        counts = self._waiter_counts
+        counts[fut] = counts.get(fut, 0) + 1
+        try:
+            # shielded so a cancelled waiter does not cancel the future the others share
+            await asyncio.shield(fut)
+        finally:
+            remaining = counts.pop(fut) - 1
+            if remaining:
+                counts[fut] = remaining
+            elif not fut.done() and self._waiters.get(event) is fut:
+                # every waiter was cancelled, so the event no longer has to be parsed for them
+                del self._waiters[event]
+                fut.cancel()
 
     async def handle_interaction(self, payload: InteractionCreate) -> None: ...
 
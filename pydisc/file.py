@@ -34,34 +34,56 @@ from .missing import MISSING, MissingOr
 __all__ = ("File",)
 
 
+def _noop_close(*_: Any) -> None:
+    pass
+
+
 class File:
     """Represents a file you can send with a message."""
 
+    __slots__ = (
+        "_buffer",
+        "_fp",
+        "_original_pos",
+        "_owner",
+        "_close",
+        "_filename",
+        "_spoiler",
+        "_description",
+        "_payload",
+    )
+
     def __init__(
         self,
-        fp: str | bytes | os.PathLike[Any] | io.BufferedIOBase,
+        fp: str | bytes | os.PathLike[Any] | io.BufferedIOBase | bytearray | memoryview,
         filename: MissingOr[str] = MISSING,
         *,
         spoiler: MissingOr[bool] = MISSING,
         description: str | None = None,
     ) -> None:
-        self.buffer: IO[Any]
-        """The buffer of this file. You should not mangle this."""
+        self._buffer: IO[Any] | None
+        self._fp: str | bytes | os.PathLike[Any] | None
 
-        if isinstance(fp, io.IOBase):
+        if isinstance(fp, (bytearray, memoryview)):
+            # in-memory file contents, ``bytes`` is still treated as a path for backwards compatibility
+            self._fp = None
+            self._original_pos = 0
+            self._owner = True
+            self._set_buffer(io.BytesIO(fp))
+        elif isinstance(fp, io.IOBase):
             if not (fp.seekable() and fp.readable()):
                 raise ValueError("file buffer must be seekable and readable")
-            self.buffer = fp  # type: ignore
+            self._fp = None
             self._original_pos = fp.tell()
             self._owner = False
+            self._set_buffer(fp)  # type: ignore
         else:
-            self.buffer = open(fp, "rb")
+            # paths are opened on first use, so unsent files do not hold a descriptor
+            self._fp = fp
+            self._buffer = None
             self._original_pos = 0
             self._owner = True
 
-        self._close = self.buffer.close
-        self.buffer.close = lambda *_: None
-
         if filename is MISSING:
             if isinstance(fp, str):
                 _, filename = os.path.split(fp)
@@ -69,11 +91,25 @@ class File:
                 name: str = getattr(fp, "name", "untitled")
                 filename = name
 
-        self.spoiler: bool = spoiler or filename.startswith("SPOILER_")
-        """Whether this file is marked as spoiler."""
-        self._filename: str = filename.removeprefix("SPOILER_")
-        self.description: str | None = description
-        """The file description."""
+        is_spoiler = filename.startswith("SPOILER_")
+        self._spoiler: bool = bool(spoiler) or is_spoiler
+        self._filename: str = filename[8:] if is_spoiler else filename
+        self._description: str | None = description
+        self._payload: dict[str, Any] | None = None
+
+    def _set_buffer(self, buffer: IO[Any]) -> None:
+        # aiohttp closes upload buffers once sent, which would break retries and reuse, so
+        # closing is suppressed until File.close is called
+        self._close = buffer.close
+        buffer.close = _noop_close
+        self._buffer = buffer
+
+    @property
+    def buffer(self) -> IO[Any]:
+        """The buffer of this file. You should not mangle this."""
+        if self._buffer is None:
+            self._set_buffer(open(self._fp, "rb"))  # type: ignore
+        return self._buffer  # type: ignore
 
     @property
     def filename(self) -> str:
@@ -82,8 +118,30 @@ class File:
 
     @filename.setter
     def filename(self, value: str) -> None:
-        self.spoiler = value.startswith("SPOILER_") or self.spoiler
-        self._filename = value.removeprefix("SPOILER_")
+        is_spoiler = value.startswith("SPOILER_")
+        self._spoiler = is_spoiler or self._spoiler
+        self._filename = value[8:] if is_spoiler else value
+        self._payload = None
+
+    @property
+    def spoiler(self) -> bool:
+        """Whether this file is marked as spoiler."""
+        return self._spoiler
+
+    @spoiler.setter
+    def spoiler(self, value: bool) -> None:
+        self._spoiler = value
+        self._payload = None
+
+    @property
+    def description(self) -> str | None:
+        """The file description."""
+        return self._description
+
+    @description.setter
+    def description(self, value: str | None) -> None:
+        self._description = value
+        self._payload = None
 
     @property
     def uri(self) -> str:
@@ -96,24 +154,28 @@ class File:
 
     def reset(self, *, seek: bool = True) -> None:
         """Resets this file to the original position."""
-        if seek:
+        # a file that has not been opened yet is already at its original position
+        if seek and self._buffer is not None:
             self.seek(self._original_pos)
 
     def close(self) -> None:
         """Closes this file buffer."""
 
-        self.buffer.close = self._close
+        if self._buffer is None:
+            return
+
+        self._buffer.close = self._close
         if self._owner:
             self._close()
 
     def to_dict(self, idx: int) -> dict[str, Any]:
-        pd: dict[str, Any] = {
-            "id": idx,
-            "filename": self.filename,
-        }
-
-        if self.description is not None:
-            pd["description"] = self.description
-        if self.spoiler:
-            pd["flags"] = AttachmentFlags.spoiler.value
-        return pd
+        # everything but the ID is the same between calls, so it is built once until a field changes
+        payload: dict[str, Any] | None = self._payload
+        if payload is None:
+            payload = {"filename": self._filename}
+            if self._description is not None:
+                payload["description"] = self._description
+            if self._spoiler:
+                payload["flags"] = AttachmentFlags.spoiler.value
+            self._payload = payload
+        return {"id": idx, **payload}
@@ -24,9 +24,12 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
-from enum import Flag
+from collections.abc import Iterator
+from enum import KEEP, EnumType, IntFlag
+from typing import TYPE_CHECKING, Any, Self, cast
 
-from .utils import class_property
+if TYPE_CHECKING:
+    from enum import _EnumDict
 
 __all__ = (
     "PublicUserFlags",
@@ -42,8 +45,102 @@ __all__ = (
     "MemberFlags",
 )
 
+_FLAG_OPERATORS = ("__or__", "__and__", "__xor__", "__ror__", "__rand__", "__rxor__", "__invert__")
 
-class PublicUserFlags(Flag):
+
+class _FlagsMeta(EnumType):
+    def __new__(metacls, cls: str, bases: tuple[type, ...], classdict: _EnumDict, **kwds: Any) -> _FlagsMeta:
+        flags = super().__new__(metacls, cls, bases, classdict, **kwds)
+        # EnumType binds Flag's operators on every subclass that does not define
+        # them itself, so point them back to the ones of the closest flags base
+        for base in bases:
+            if isinstance(base, _FlagsMeta):
+                for name in _FLAG_OPERATORS:
+                    if name not in classdict:
+                        setattr(flags, name, getattr(base, name))
+                break
+        return flags
+
+
+class _BaseFlags(IntFlag, boundary=KEEP, metaclass=_FlagsMeta):
+    """The base class of every flags class.
+
+    Unknown bits sent by Discord are kept instead of raising, and :meth:`has`
+    is preferred over ``flag in flags`` on hot paths.
+    """
+
+    # set by the enum machinery on every flags class, declared here for type checkers
+    _flag_mask_: int
+    _inverted_: Self | None
+
+    def has(self, flag: int) -> bool:
+        """Whether all the bits of ``flag`` are set.
+
+        This is equivalent to ``flag in self``, but works on the raw integer
+        values and skips :class:`enum.Flag`'s member checks.
+        """
+        value = getattr(flag, "_value_", flag)
+        return (self._value_ & value) == value
+
+    def _from_value(self, value: int) -> Self:
+        # known combinations are cached by the enum machinery, so a dict hit
+        # skips EnumType.__call__ and Flag._missing_ entirely
+        try:
+            return cast(Self, self._value2member_map_[value])
+        except KeyError:
+            return self.__class__(value)
+
+    def __or__(self, other: int) -> Self:
+        if not isinstance(other, int):
+            return NotImplemented
+        return self._from_value(self._value_ | getattr(other, "_value_", other))
+
+    def __and__(self, other: int) -> Self:
+        if not isinstance(other, int):
+            return NotImplemented
+        return self._from_value(self._value_ & getattr(other, "_value_", other))
+
+    def __xor__(self, other: int) -> Self:
+        if not isinstance(other, int):
+            return NotImplemented
+        return self._from_value(self._value_ ^ getattr(other, "_value_", other))
+
+    def __invert__(self) -> Self:
+        # _flag_mask_ is the union of every defined flag, computed once by the enum
+        # machinery, so unknown bits are cleared rather than flipped on
+        inverted = self._inverted_
+        if inverted is None:
+            inverted = self._inverted_ = self._from_value(self._flag_mask_ & ~self._value_)
+        return inverted
+
+    __ror__ = __or__
+    __rand__ = __and__
+    __rxor__ = __xor__
+
+    @classmethod
+    def iter_set(cls, value: int) -> Iterator[str]:
+        """Yields the names of the known flags set in a raw integer value.
+
+        This only loops once per set bit, lowest first, and skips unknown bits.
+
+        Parameters
+        ----------
+        value: :class:`int`
+            The raw, non-negative, flags value.
+        """
+        if value < 0:
+            raise ValueError(f"expected a non-negative value, got {value}")
+
+        members = cls._value2member_map_
+        while value:
+            bit = value & -value
+            member = members.get(bit)
+            if member is not None and member._name_:
+                yield member._name_
+            value ^= bit
+
+
+class PublicUserFlags(_BaseFlags):
     """Represent the public flags of a :class:`User`."""
 
     staff = 1 << 0
@@ -78,7 +175,7 @@ class PublicUserFlags(Flag):
     """Whether the user is an active developer."""
 
 
-class ChannelFlags(Flag):
+class ChannelFlags(_BaseFlags):
     """Represent a channel's flags."""
 
     pinned = 1 << 1
@@ -89,7 +186,7 @@ class ChannelFlags(Flag):
     """In case of a media forum, whether the download options are hidden from messages."""
 
 
-class SystemChannelFlags(Flag):
+class SystemChannelFlags(_BaseFlags):
     """Represent the flags of a guild's system channel."""
 
     suppress_join_notifications = 1 << 0
@@ -108,7 +205,7 @@ class SystemChannelFlags(Flag):
     """Whether a message is sent when an emoji is added."""
 
 
-class MessageFlags(Flag):
+class MessageFlags(_BaseFlags):
     """Represent the flags of a message."""
 
     crossposted = 1 << 0
@@ -139,7 +236,7 @@ class MessageFlags(Flag):
     """Whether this message has components v2."""
 
 
-class Intents(Flag):
+class Intents(_BaseFlags):
     """Represents the intents for a gateway connection."""
 
     guilds = 1 << 0
@@ -326,64 +423,50 @@ class Intents(Flag):
     - ``message_poll_vote_remove``
     """
 
-    @class_property
-    def messages(cls) -> Intents:
-        """A shortcut for ``Intents.guild_messages | Intents.direct_messages``"""
-        return cls.guild_messages | cls.direct_messages
-
-    @class_property
-    def message_typing(cls) -> Intents:
-        """An alias for ``Intents.guild_message_typing | Intents.direct_message_typing``"""
-        return cls.guild_message_typing | cls.direct_message_typing
-
-    @class_property
-    def auto_moderation(cls) -> Intents:
-        """An alias for ``Intents.auto_moderation_configuration | Intents.auto_moderation_execution``"""
-        return cls.auto_moderation_configuration | cls.auto_moderation_execution
-
-    @class_property
-    def message_polls(cls) -> Intents:
-        """An alias for ``Intents.guild_message_polls | Intents.direct_message_polls``"""
-        return cls.guild_message_polls | cls.direct_message_polls
-
-    @class_property
-    def message_reactions(cls) -> Intents:
-        """An alias for ``Intents.guild_message_reactions | Intents.direct_message_reactions``"""
-        return cls.guild_message_reactions | cls.direct_message_reactions
+    messages = guild_messages | direct_messages
+    """A shortcut for ``Intents.guild_messages | Intents.direct_messages``"""
+    message_typing = guild_message_typing | direct_message_typing
+    """An alias for ``Intents.guild_message_typing | Intents.direct_message_typing``"""
+    auto_moderation = auto_moderation_configuration | auto_moderation_execution
+    """An alias for ``Intents.auto_moderation_configuration | Intents.auto_moderation_execution``"""
+    message_polls = guild_message_polls | direct_message_polls
+    """An alias for ``Intents.guild_message_polls | Intents.direct_message_polls``"""
+    message_reactions = guild_message_reactions | direct_message_reactions
+    """An alias for ``Intents.guild_message_reactions | Intents.direct_message_reactions``"""
 
     @classmethod
     def all(cls) -> Intents:
         """Returns an ``Intents`` instace with all flags set."""
-        return (
-            cls.guilds
-            | cls.guild_members
-            | cls.guild_moderation
-            | cls.guild_expressions
-            | cls.guild_integrations
-            | cls.guild_webhooks
-            | cls.guild_invites
-            | cls.guild_voice_states
-            | cls.guild_presences
-            | cls.messages
-            | cls.message_reactions
-            | cls.message_typing
-            | cls.message_content
-            | cls.guild_scheduled_events
-            | cls.auto_moderation
-            | cls.message_polls
-        )
+        return _INTENTS_ALL
 
     @classmethod
     def default(cls) -> Intents:
         """Returns a ``Intents`` instance with all flags set, except for priviliged."""
-        self = cls.all()
-        self &= ~cls.message_content
-        self &= ~cls.guild_presences
-        self &= ~cls.guild_members
-        return self
+        return _INTENTS_DEFAULT
+
+
+_INTENTS_ALL = (
+    Intents.guilds
+    | Intents.guild_members
+    | Intents.guild_moderation
+    | Intents.guild_expressions
+    | Intents.guild_integrations
+    | Intents.guild_webhooks
+    | Intents.guild_invites
+    | Intents.guild_voice_states
+    | Intents.guild_presences
+    | Intents.messages
+    | Intents.message_reactions
+    | Intents.message_typing
+    | Intents.message_content
+    | Intents.guild_scheduled_events
+    | Intents.auto_moderation
+    | Intents.message_polls
+)
+_INTENTS_DEFAULT = _INTENTS_ALL & ~(Intents.message_content | Intents.guild_presences | Intents.guild_members)
 
 
-class AttachmentFlags(Flag):
+class AttachmentFlags(_BaseFlags):
     """Represents an attachment flags."""
 
     clip = 1 << 0
@@ -400,40 +483,61 @@ class AttachmentFlags(Flag):
     """Whether the attachment is an animated image."""
 
 
-class Permissions(Flag):
-    """Represents the permissions of a Discord object."""
-
-    def __new__(cls, value: int = 0, **perms: bool) -> None:
+class _PermissionsMeta(_FlagsMeta):
+    # Enum swaps out the __new__ defined in the class body after creation,
+    # so keyword toggles have to be handled when the class is called.
+    def __call__(cls, value: int = 0, /, **perms: bool) -> Permissions:
         if not isinstance(value, int):
             raise TypeError(f"expected an int, got a {value.__class__.__name__}")
 
-        self = super().__new__(cls, value)
-
-        for perm, toggle in perms.items():
-            try:
-                f = getattr(cls, perm)
-            except AttributeError:
-                raise AttributeError(f"{perm} is not a valid permission")
+        if perms:
+            members = cls._member_map_
+            set_mask = clear_mask = 0
+
+            for perm, toggle in perms.items():
+                try:
+                    flag = members[perm]._value_
+                except KeyError:
+                    raise AttributeError(f"{perm} is not a valid permission") from None
+
+                if toggle is True:
+                    set_mask |= flag
+                elif toggle is False:
+                    clear_mask |= flag
+                else:
+                    raise TypeError(f"expected True or False for permission {perm}, got {toggle} instead")
+            value = (int(value) | set_mask) & ~clear_mask
+        # typed as the class it is, otherwise __new__ resolves to the metaclass one
+        flags_cls = cast("type[Permissions]", cls)
+        return flags_cls.__new__(flags_cls, value)
+
+
+class Permissions(_BaseFlags, metaclass=_PermissionsMeta):
+    """Represents the permissions of a Discord object."""
 
-            if toggle is True:
-                self |= f
-            elif toggle is False:
-                self &= ~f
-            else:
-                raise TypeError(f"expected True or False for permission {perm}, got {toggle} instead")
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, Permissions):
+            return NotImplemented
+        value = self._value_
+        return (value & other._value_) == value
 
     def __lt__(self, other: object) -> bool:
-        if not isinstance(other, self.__class__):
+        if not isinstance(other, Permissions):
             return NotImplemented
-        return (self.value & other.value) == self.value
+        value, other_value = self._value_, other._value_
+        return value != other_value and (value & other_value) == value
 
-    def __gt__(self, other: object) -> bool:
-        if not isinstance(other, self.__class__):
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, Permissions):
             return NotImplemented
-        return (self.value | other.value) == self.value
+        other_value = other._value_
+        return (self._value_ & other_value) == other_value
 
-    __le__ = __lt__
-    __ge__ = __gt__
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, Permissions):
+            return NotImplemented
+        value, other_value = self._value_, other._value_
+        return value != other_value and (value & other_value) == other_value
 
     @classmethod
     def none(cls) -> Permissions:
@@ -443,101 +547,47 @@ class Permissions(Flag):
     @classmethod
     def all(cls) -> Permissions:
         """Returns a Permissions object with all flags set."""
-        return (
-            Permissions.general()
-            | Permissions.membership()
-            | Permissions.text_channels()
-            | Permissions.voice_channels()
-            | Permissions.apps()
-            | Permissions.stage_channels()
-            | Permissions.events()
-            | Permissions.advanced()
-        )
+        return _PERMISSIONS_ALL
 
     @classmethod
     def general(cls) -> Permissions:
         """Returns a Permissions object with all the UI "General" section permissions enabled."""
-        return (
-            Permissions.view_channels
-            | Permissions.manage_channels
-            | Permissions.manage_roles
-            | Permissions.create_guild_expressions
-            | Permissions.manage_guild_expressions
-            | Permissions.view_audit_log
-            | Permissions.view_guild_insights
-            | Permissions.manage_webhooks
-            | Permissions.manage_guild
-        )
+        return _PERMISSIONS_GENERAL
 
     @classmethod
     def membership(cls) -> Permissions:
         """Returns a Permissions obejct with all the UI "Membership" section permissions enabled."""
-        return (
-            Permissions.create_instant_invite
-            | Permissions.change_nickname
-            | Permissions.manage_nicknames
-            | Permissions.ban_members
-            | Permissions.moderate_members
-        )
+        return _PERMISSIONS_MEMBERSHIP
 
     @classmethod
     def text_channels(cls) -> Permissions:
         """Returns a Permissions object with all the UI "Text channels" section permissions enabled."""
-        return (
-            Permissions.send_messages
-            | Permissions.send_messages_in_threads
-            | Permissions.create_public_threads
-            | Permissions.create_private_threads
-            | Permissions.embed_links
-            | Permissions.attach_files
-            | Permissions.add_reactions
-            | Permissions.use_external_emojis
-            | Permissions.use_external_stickers
-            | Permissions.mention_everyone
-            | Permissions.manage_messages
-            | Permissions.pin_messages
-            | Permissions.manage_threads
-            | Permissions.read_message_history
-            | Permissions.send_tts_messages
-            | Permissions.send_voice_messages
-            | Permissions.send_polls
-        )
+        return _PERMISSIONS_TEXT_CHANNELS
 
     @classmethod
     def voice_channels(cls) -> Permissions:
         """Returns a Permissions object with all the UI "Voice channels" section permissions enabled."""
-        return (
-            Permissions.connect
-            | Permissions.speak
-            | Permissions.stream
-            | Permissions.use_soundboard
-            | Permissions.use_external_sounds
-            | Permissions.use_vad
-            | Permissions.priority_speaker
-            | Permissions.mute_members
-            | Permissions.deafen_members
-            | Permissions.move_members
-        )
+        return _PERMISSIONS_VOICE_CHANNELS
 
     @classmethod
     def apps(cls) -> Permissions:
         """Returns a Permissions object with all the UI "Apps" section permissions enabled."""
-        return Permissions.use_application_commands | Permissions.use_embedded_activities | Permissions.use_external_apps
+        return _PERMISSIONS_APPS
 
     @classmethod
     def stage_channels(cls) -> Permissions:
         """Returns a Permissions obejct with all the UI "Stage channels" section permissions enabled."""
-        return Permissions.request_to_speak
+        return _PERMISSIONS_STAGE_CHANNELS
 
     @classmethod
     def events(cls) -> Permissions:
         """Returns a Permissions object with all the UI "Events" section permissions enabled."""
-        return Permissions.create_events | Permissions.manage_events
+        return _PERMISSIONS_EVENTS
 
     @classmethod
     def advanced(cls) -> Permissions:
         """Returns a Permissions object with all the UI "Advanced" section permissions enabled."""
-        return Permissions.administrator
+        return _PERMISSIONS_ADVANCED
 
     create_instant_invite = 1 << 0
     """Allows creating instant invites."""
@@ -641,7 +691,74 @@ class Permissions(Flag):
     """Allows pinning and unpinning messages."""
 
 
-class EmbedFlags(Flag):
+_PERMISSIONS_GENERAL = (
+    Permissions.view_channels
+    | Permissions.manage_channels
+    | Permissions.manage_roles
+    | Permissions.create_guild_expressions
+    | Permissions.manage_guild_expressions
+    | Permissions.view_audit_log
+    | Permissions.view_guild_insights
+    | Permissions.manage_webhooks
+    | Permissions.manage_guild
+)
+_PERMISSIONS_MEMBERSHIP = (
+    Permissions.create_instant_invite
+    | Permissions.change_nickname
+    | Permissions.manage_nicknames
+    | Permissions.ban_members
+    | Permissions.moderate_members
+)
+_PERMISSIONS_TEXT_CHANNELS = (
+    Permissions.send_messages
+    | Permissions.send_messages_in_threads
+    | Permissions.create_public_threads
+    | Permissions.create_private_threads
+    | Permissions.embed_links
+    | Permissions.attach_files
+    | Permissions.add_reactions
+    | Permissions.use_external_emojis
+    | Permissions.use_external_stickers
+    | Permissions.mention_everyone
+    | Permissions.manage_messages
+    | Permissions.pin_messages
+    | Permissions.manage_threads
+    | Permissions.read_message_history
+    | Permissions.send_tts_messages
+    | Permissions.send_voice_messages
+    | Permissions.send_polls
+)
+_PERMISSIONS_VOICE_CHANNELS = (
+    Permissions.connect
+    | Permissions.speak
+    | Permissions.stream
+    | Permissions.use_soundboard
+    | Permissions.use_external_sounds
+    | Permissions.use_vad
+    | Permissions.priority_speaker
+    | Permissions.mute_members
+    | Permissions.deafen_members
+    | Permissions.move_members
+)
+_PERMISSIONS_APPS = (
+    Permissions.use_application_commands | Permissions.use_embedded_activities | Permissions.use_external_apps
+)
+_PERMISSIONS_STAGE_CHANNELS = Permissions.request_to_speak
+_PERMISSIONS_EVENTS = Permissions.create_events | Permissions.manage_events
+_PERMISSIONS_ADVANCED = Permissions.administrator
+_PERMISSIONS_ALL = (
+    _PERMISSIONS_GENERAL
+    | _PERMISSIONS_MEMBERSHIP
+    | _PERMISSIONS_TEXT_CHANNELS
+    | _PERMISSIONS_VOICE_CHANNELS
+    | _PERMISSIONS_APPS
+    | _PERMISSIONS_STAGE_CHANNELS
+    | _PERMISSIONS_EVENTS
+    | _PERMISSIONS_ADVANCED
+)
+
+
+class EmbedFlags(_BaseFlags):
     """Represents an embed flags."""
 
     contains_explicit_media = 1 << 4
@@ -653,7 +770,7 @@ class EmbedFlags(Flag):
 
 
 # thanks discord for the lack of documentation here
-class ActivityFlags(Flag):
+class ActivityFlags(_BaseFlags):
     """Represents the flags of an activity."""
 
     instance = 1 << 0
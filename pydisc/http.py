@@ -366,7 +366,8 @@ class RESTHandler:
 
         if "json" in kwargs:
             headers["Content-Type"] = "application/json"
-            kwargs["data"] = utils._to_json(kwargs.pop("json"))
+            # request bodies are sent as bytes, so skip orjson's bytes -> str -> bytes round trip
+            kwargs["data"] = utils._to_json_bytes(kwargs.pop("json"))
 
         try:
             reason = kwargs.pop("reason")
@@ -39,12 +39,18 @@ try:
     def _to_json(obj: Any) -> str:
         return __to_json(obj).decode("utf-8")  # type: ignore
 
+    def _to_json_bytes(obj: Any) -> bytes:
+        return __to_json(obj)  # type: ignore
+
 except ImportError:
     from json import dumps as __to_json, loads as _from_json
 
     def _to_json(obj: Any) -> str:
         return __to_json(obj, separators=(",", ":"), ensure_ascii=True)
 
+    def _to_json_bytes(obj: Any) -> bytes:
+        return _to_json(obj).encode("utf-8")
+
 
 if TYPE_CHECKING:
     _from_json: Callable[..., Any]
@@ -60,6 +66,7 @@ DISCORD_EPOCH = 1420070400000
 __all__ = (
     "_from_json",
     "_to_json",
+    "_to_json_bytes",
     "_get_snowflake",
     "flatten_literal_params",
     "normalise_optional_params",